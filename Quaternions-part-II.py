@@ -2,6 +2,8 @@ from manim import *
 from math import atan, sin, cos, sqrt
 import numpy as np
 
+from euler_expansions import load_expansions
+
 my_tex_template = TexTemplate()
 my_tex_template.add_to_preamble(r"\usepackage{xcolor}")
 my_tex_template.add_to_preamble(r"\usepackage[usenames,dvipsnames]{xcolor}")
@@ -410,81 +412,8 @@ class YXZQuaternionExpansion(Scene):
     
         
 
-        # Dictionary of Euler orders and their quaternion expressions
-        euler_dict = {
-            "XYZ": [
-                r"  = & (B_1 B_2 B_3 + A_1 A_2 A_3) \\",
-                r"  + & (A_1 B_2 B_3 - A_2 A_3 B_1) \,i \\",
-                r"  + & (A_1 A_3 B_2 + A_2 B_1 B_3) \,j \\",
-                r"  + & (A_3 B_1 B_2 - A_1 A_2 B_3) \,k"
-            ],
-            "ZYX": [
-                r"  = & (B_1 B_2 B_3 - A_1 A_2 A_3) \\",
-                r"  + & (A_1 A_2 B_3 + A_3 B_1 B_2) \,i \\",
-                r"  + & (A_2 B_1 B_3 - A_1 A_3 B_2) \,j \\",
-                r"  + & (A_1 B_2 B_3 + A_2 A_3 B_1) \,k"
-            ],
-            "YZX": [
-                r"  = & (B_1 B_2 B_3 + A_1 A_2 A_3) \\",
-                r"  + & (A_3 B_1 B_2 - A_1 A_2 B_3) \,i \\",
-                r"  + & (A_1 B_2 B_3 - A_2 A_3 B_1) \,j \\",
-                r"  + & (A_1 A_3 B_2 + A_2 B_1 B_3) \,k"
-            ],
-            "XZY": [
-                r"  = & (B_1 B_2 B_3 - A_1 A_2 A_3) \\",
-                r"  + & (A_1 B_2 B_3 + A_2 A_3 B_1) \,i \\",
-                r"  + & (A_1 A_2 B_3 + A_3 B_1 B_2) \,j \\",
-                r"  + & (A_2 B_1 B_3 - A_1 A_3 B_2) \,k"
-            ],
-            "YXZ": [
-                r"  = & (B_1 B_2 B_3 - A_1 A_2 A_3) \\",
-                r"  + & (A_2 B_1 B_3 - A_1 A_3 B_2) \,i \\",
-                r"  + & (A_1 B_2 B_3 + A_2 A_3 B_1) \,j \\",
-                r"  + & (A_1 A_2 B_3 + A_3 B_1 B_2) \,k"
-            ],
-            "ZXY": [
-                r"  = & (B_1 B_2 B_3 + A_1 A_2 A_3) \\",
-                r"  + & (A_1 A_3 B_2 + A_2 B_1 B_3) \,i \\",
-                r"  + & (A_3 B_1 B_2 - A_1 A_2 B_3) \,j \\",
-                r"  + & (A_1 B_2 B_3 - A_2 A_3 B_1) \,k"
-            ],
-            "ZYZ": [
-                r"  = & (B_1 B_2 B_3 - A_1 A_3 B_2) \\",
-                r"  + & (A_1 A_2 B_3 - A_2 A_3 B_1) \,i \\",
-                r"  + & (A_1 A_2 A_3 + A_2 B_1 B_3) \,j \\",
-                r"  + & (A_1 B_2 B_3 + A_3 B_1 B_2) \,k"
-            ],
-            "XYX": [
-                r"  = & (B_1 B_2 B_3 - A_1 A_3 B_2) \\",
-                r"  + & (A_1 B_2 B_3 + A_3 B_1 B_2) \,i \\",
-                r"  + & (A_1 A_2 A_3 + A_2 B_1 B_3) \,j \\",
-                r"  + & (A_2 A_3 B_1 - A_1 A_2 B_3) \,k"
-            ],
-            "YXY": [
-                r"  = & (B_1 B_2 B_3 - A_1 A_3 B_2) \\",
-                r"  + & (A_1 A_2 A_3 + A_2 B_1 B_3) \,i \\",
-                r"  + & (A_1 B_2 B_3 + A_3 B_1 B_2) \,j \\",
-                r"  + & (A_1 A_2 B_3 - A_2 A_3 B_1) \,k"
-            ],
-            "XZX": [
-                r"  = & (B_1 B_2 B_3 - A_1 A_3 B_2) \\",
-                r"  + & (A_1 B_2 B_3 + A_3 B_1 B_2) \,i \\",
-                r"  + & (A_1 A_2 B_3 - A_2 A_3 B_1) \,j \\",
-                r"  + & (A_1 A_2 A_3 + A_2 B_1 B_3) \,k"
-            ],
-            "ZXZ": [
-                r"  = & (B_1 B_2 B_3 - A_1 A_3 B_2) \\",
-                r"  + & (A_1 A_2 A_3 + A_2 B_1 B_3) \,i \\",
-                r"  + & (A_2 A_3 B_1 - A_1 A_2 B_3) \,j \\",
-                r"  + & (A_1 B_2 B_3 + A_3 B_1 B_2) \,k"
-            ],
-            "YZY": [
-                r"  = & (B_1 B_2 B_3 - A_1 A_3 B_2) \\",
-                r"  + & (A_2 A_3 B_1 - A_1 A_2 B_3) \,i \\",
-                r"  + & (A_1 B_2 B_3 + A_3 B_1 B_2) \,j \\",
-                r"  + & (A_1 A_2 A_3 + A_2 B_1 B_3) \,k"
-            ],
-        }
+        # Euler orders and their quaternion expressions, from the equation generator's cache
+        euler_dict = {order: expansion["latex"] for order, expansion in load_expansions()["orders"].items()}
 
         # Animate through each order
         n = 0
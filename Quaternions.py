@@ -2,6 +2,13 @@ from manim import *
 from math import atan, sin, cos, sqrt
 import numpy as np
 
+from live_mobjects import LiveMathTex, LiveValue, MultiTracedPath, PosableLine3D, RingTracedPath, SignToggle, VertexDots, VertexMesh
+from quaternion_math import quaternion_multiply, rotate_points
+from reactive import Computed
+from play_cache import cached_play
+from sharding import play_tracker
+from updaters import TransparentCullingScene, UpdaterScheduler
+
 
 
 # Custom LaTeX template with colors
@@ -1455,9 +1462,9 @@ class EulersFormula(MovingCameraScene):
 
         # Label for cosine and sine
         cos_label = MathTex(r"\cos \theta", font_size=22, color=BLUE).move_to(line_cos)
-        cos_label.add_updater(lambda m: m.become(MathTex(r"\cos \theta", font_size=22, color=BLUE).move_to(line_cos)))
+        cos_label.add_updater(lambda m: m.move_to(line_cos))
         sin_label = MathTex(r"\sin \theta", font_size=22, color=GREEN).move_to(line_sin)
-        sin_label.add_updater(lambda m: m.become(MathTex(r"\sin \theta", font_size=22, color=GREEN).move_to(line_sin)))
+        sin_label.add_updater(lambda m: m.move_to(line_sin))
         self.play(Write(cos_label), Write(sin_label))
         self.wait(5)
         
@@ -1478,7 +1485,7 @@ class EulersFormula(MovingCameraScene):
         # Show the corresponding complex exponential (as a vector)
         
         label_exp = MathTex(r"e^{i\theta}", font_size=22).next_to(dot, RIGHT*0.2)
-        label_exp.add_updater(lambda m: m.become(MathTex(r"e^{i\theta}", font_size=22).next_to(dot, RIGHT*0.2)))
+        label_exp.add_updater(lambda m: m.next_to(dot, RIGHT*0.2))
         self.play(Write(label_exp))
         self.wait()
         
@@ -1499,10 +1506,10 @@ class EulersFormula(MovingCameraScene):
         
         self.wait()
         
-        cos_label = MathTex(rf"\cos \theta = {dot.get_x():.2f}", font_size=22, color=BLUE).move_to(RIGHT*2.5 + UP * 0.2)
-        cos_label.add_updater(lambda m: m.become(MathTex(rf"\cos \theta = {dot.get_x():.2f}", font_size=22, color=BLUE).move_to(RIGHT*2.5 + UP * 0.2)))
-        sin_label = MathTex(rf"\sin \theta = {dot.get_y():.2f}", font_size=22, color=GREEN).move_to(RIGHT*2.5 + DOWN * 0.2)
-        sin_label.add_updater(lambda m: m.become(MathTex(rf"\sin \theta = {dot.get_y():.2f}", font_size=22, color=GREEN).move_to(RIGHT*2.5 + DOWN * 0.2)))
+        cos_label = LiveMathTex(r"\cos \theta =", LiveValue(dot.get_x), font_size=22, color=BLUE).move_to(RIGHT*2.5 + UP * 0.2)
+        cos_label.add_updater(lambda m: m.refresh().move_to(RIGHT*2.5 + UP * 0.2))
+        sin_label = LiveMathTex(r"\sin \theta =", LiveValue(dot.get_y), font_size=22, color=GREEN).move_to(RIGHT*2.5 + DOWN * 0.2)
+        sin_label.add_updater(lambda m: m.refresh().move_to(RIGHT*2.5 + DOWN * 0.2))
         self.play(Write(cos_label), Write(sin_label))
         
         self.play(
@@ -1629,23 +1636,31 @@ class ComplexRotationsSquare(MovingCameraScene):
 
         theta = ValueTracker(0)
 
-        def rotator():
-            return (cos(theta.get_value()), sin(theta.get_value()))
+        rotator = Computed(lambda: (cos(theta.get_value()), sin(theta.get_value())), theta)
 
         dot_colors = [RED, BLUE, GREEN, ORANGE]
 
         # Initial square vertices
         base_points = [(1, 1), (1, -1), (-1, -1), (-1, 1)]
 
-        # Create dots with updaters
-        dots = []
-        for i, pt in enumerate(base_points):
-            dot = Dot(color=dot_colors[i]).add_updater(
-                lambda m, pt=pt: m.move_to(
-                    axes.c2p(*complex_multiply(pt, rotator()))
-                )
-            )
-            dots.append(dot)
+        # Vertices for a rotator (cos, sin) of shape (2,) or one per frame (F, 2)
+        base = np.array(base_points, dtype=float)
+
+        def square_vertices(rotators):
+            x, y = complex_multiply(base.T, (rotators[..., 0, None], rotators[..., 1, None]))
+            # The axes are linear, so c2p is applied as origin + x * e_x + y * e_y
+            origin = axes.c2p(0, 0)
+            return origin + x[..., None] * (axes.c2p(1, 0) - origin) + y[..., None] * (axes.c2p(0, 1) - origin)
+
+        def rotators(thetas):
+            return np.column_stack([np.cos(thetas), np.sin(thetas)])
+
+        # One group moves all four dots from a single vectorized product
+        dots = [Dot(color=color) for color in dot_colors]
+        square = VertexDots(dots, lambda: square_vertices(np.array(rotator())))
+        square.add_updater(lambda m: m.update_positions())
+        square.update_positions()
+        self.add(square)
 
         self.play(*[Write(dot) for dot in dots])
 
@@ -1669,29 +1684,19 @@ class ComplexRotationsSquare(MovingCameraScene):
         self.play(Write(text))
 
                 # Dynamic LaTeX for e^{iθ}
-        exp_text = MathTex(
-            r"q = e^{i\theta} = "
-            + f"{cos(theta.get_value()):.2f} "
-            + ("+" if sin(theta.get_value()) >= 0 else "-")
-            + rf"\textcolor{{brightblue}}{{{abs(sin(theta.get_value())):.2f}}}\textcolor{{brightblue}}{{i}}",
+        exp_text = LiveMathTex(
+            r"q = e^{i\theta} =",
+            LiveValue(lambda: rotator()[0]),
+            LiveValue(lambda: rotator()[1], fmt=lambda v: "+" if v >= 0 else "-", max_chars=1),
+            LiveValue(lambda: abs(rotator()[1]), color="#1E90FF"),
+            ("i", "#1E90FF"),
             font_size=100,
             tex_template=my_tex_template,
         ).to_edge(DOWN).shift(DOWN)
 
         self.play(Write(exp_text))
 
-        exp_text.add_updater(
-            lambda m: m.become(
-                MathTex(
-                    r"q = e^{i\theta} = "
-                    + f"{cos(theta.get_value()):.2f} "
-                    + ("+" if sin(theta.get_value()) >= 0 else "-")
-                    + rf"\textcolor{{brightblue}}{{{abs(sin(theta.get_value())):.2f}}}\textcolor{{brightblue}}{{i}}",
-                    font_size=100,
-                    tex_template=my_tex_template,
-                ).to_edge(DOWN).shift(DOWN)
-            )
-        )
+        exp_text.add_updater(lambda m: m.refresh().to_edge(DOWN).shift(DOWN))
 
         # θ label
         theta_text = MathTex(r"\theta = ", font_size=100, tex_template=my_tex_template).to_corner(UR).shift(LEFT*2 + UP)
@@ -1702,24 +1707,26 @@ class ComplexRotationsSquare(MovingCameraScene):
 
 
         # Animate rotation
-        self.play(
-            theta.animate.increment_value(360 * DEGREES),
+        play_tracker(
+            self, theta, 360 * DEGREES,
             run_time=10,
             rate_func=rate_functions.ease_in_out_sine,
+            bake=[(square, lambda thetas: square_vertices(rotators(thetas)))],
         )
 
         # Trails
         trails = [
-            TracedPath(dot.get_center, stroke_color=dot.get_color(), stroke_width=2, dissipating_time=0)
+            RingTracedPath(dot.get_center, stroke_color=dot.get_color(), stroke_width=2, max_points=4096)
             for dot in dots
         ]
         for trail in trails:
             self.add(trail)
 
-        self.play(
-            theta.animate.increment_value(-360 * DEGREES),
+        play_tracker(
+            self, theta, -360 * DEGREES,
             run_time=10,
             rate_func=rate_functions.ease_in_out_sine,
+            bake=[(square, lambda thetas: square_vertices(rotators(thetas)))],
         )
 
         self.wait(2)
@@ -1732,29 +1739,9 @@ class ComplexRotationsSquare(MovingCameraScene):
         
         
         
-class QuaternionRotations3D(ThreeDScene):
+class QuaternionRotations3D(TransparentCullingScene, ThreeDScene):
     def construct(self):
         
-        def quaternion_multiply(q1, q2, w=False):
-            """
-            Multiply two quaternions.
-            q1 and q2 are tuples or lists: (w, x, y, z)
-            Returns: (w, x, y, z)
-            """
-            w1, x1, y1, z1 = q1
-            w2, x2, y2, z2 = q2
-
-            _w = w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2
-            x = w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2
-            y = w1 * y2 - x1 * z2 + y1 * w2 + z1 * x2
-            z = w1 * z2 + x1 * y2 - y1 * x2 + z1 * w2
-            
-            if w:
-                return (_w, x, y, z)
-            else:
-                return (x, y, z)
-            
-            
         def normalize(v):
             v = np.array(v, dtype=float)
             norm = np.linalg.norm(v)
@@ -1763,20 +1750,8 @@ class QuaternionRotations3D(ThreeDScene):
             return v / norm
 
         
-        def get_axis():
-            return normalize(axis_dot.get_center())
-        
-        def q(dash):
-            return (cos(theta.get_value()), *(get_axis()[i] * sin(theta.get_value()) * [-1, 1][dash == 0] for i in range(3)))
-        
-        def live_pos(dot):
-            dot.update()
-            return dot.get_center()
-        
-        def connect(dot_a, dot_b, color=GREY):
-            return Line(color=color).add_updater(
-                lambda m: m.put_start_and_end_on(live_pos(dot_a), live_pos(dot_b))
-            )
+        # Vertices, edges and faces update once per frame, vertices first
+        scheduler = UpdaterScheduler(cull_transparent=True)
         
         
         axes = ThreeDAxes()
@@ -1805,8 +1780,14 @@ class QuaternionRotations3D(ThreeDScene):
         axis_dot.set_opacity(0)
         self.add(axis_dot)
         
+        # Everything derived from theta and axis_dot is evaluated at most once per frame
+        get_axis = Computed(lambda: normalize(axis_dot.get_center()), axis_dot)
+        trig = Computed(lambda: (cos(theta.get_value()), sin(theta.get_value())), theta)
+        rotation = Computed(lambda: np.array([trig[0], *(get_axis() * trig[1])]), trig, get_axis)
+        signs = Computed(lambda: np.where(rotation() >= 0, 1, -1), rotation)
+        
         
-        line = Line3D(
+        line = PosableLine3D(
             start=-3 * get_axis(),
             end=3 * get_axis(),
             color=GREEN,
@@ -1814,12 +1795,7 @@ class QuaternionRotations3D(ThreeDScene):
         )
         
         def axis_update(line):
-            line.become(Line3D(
-            start=-3 * get_axis(),
-            end=3 * get_axis(),
-            color=GREEN,
-            thickness=0.04,
-        ))
+            line.put_start_and_end_on(-3 * get_axis(), 3 * get_axis())
             
         line.add_updater(axis_update)
         #self.add_updater(lambda dt: print("q:", q(0)))
@@ -1834,45 +1810,56 @@ class QuaternionRotations3D(ThreeDScene):
         dot_colors = [RED, BLUE, GREEN, YELLOW, ORANGE, PURPLE, TEAL, PINK]
 
 
-        dot1 = Dot3D(color=dot_colors[0]).add_updater(lambda m: m.move_to(quaternion_multiply([0, 1, 1, 1], q(dash=0))))
-        dot2 = Dot3D(color=dot_colors[1]).add_updater(lambda m: m.move_to(quaternion_multiply([0, 1, 1, -1], q(dash=0))))
-        dot3 = Dot3D(color=dot_colors[2]).add_updater(lambda m: m.move_to(quaternion_multiply([0, 1, -1, 1], q(dash=0))))
-        dot4 = Dot3D(color=dot_colors[3]).add_updater(lambda m: m.move_to(quaternion_multiply([0, 1, -1, -1], q(dash=0))))
-        dot5 = Dot3D(color=dot_colors[4]).add_updater(lambda m: m.move_to(quaternion_multiply([0, -1, 1, 1], q(dash=0))))
-        dot6 = Dot3D(color=dot_colors[5]).add_updater(lambda m: m.move_to(quaternion_multiply([0, -1, 1, -1], q(dash=0))))
-        dot7 = Dot3D(color=dot_colors[6]).add_updater(lambda m: m.move_to(quaternion_multiply([0, -1, -1, 1], q(dash=0))))
-        dot8 = Dot3D(color=dot_colors[7]).add_updater(lambda m: m.move_to(quaternion_multiply([0, -1, -1, -1], q(dash=0))))
-        
-            
-        
-        dots = [dot1, dot2, dot3, dot4, dot5, dot6, dot7, dot8]
-
-        for d in dots:
-            d.update(0)
-        
-        
-        line1  = connect(dot1, dot2)
-        line2  = connect(dot4, dot3)
-        line3  = connect(dot1, dot3)
-        line4  = connect(dot2, dot4)
-        line5  = connect(dot5, dot6)
-        line6  = connect(dot8, dot7)
-        line7  = connect(dot5, dot7)
-        line8  = connect(dot6, dot8)
-        line9  = connect(dot1, dot5)
-        line10 = connect(dot2, dot6)
-        line11 = connect(dot3, dot7)
-        line12 = connect(dot4, dot8)
-        
-        lines = [line1, line2, line3, line4, line5, line6, line7, line8, line9, line10, line11, line12]
-        
-        self.add(*dots)
-        self.add(*lines)
-        
-        self.play(Write(VGroup(*dots, *lines)))
-        
-
-        # Define faces using dot indices
+        # Cube corners, and the same corners as pure quaternions (0, x, y, z)
+        cube_vertices = np.array([
+            [1, 1, 1], [1, 1, -1], [1, -1, 1], [1, -1, -1],
+            [-1, 1, 1], [-1, 1, -1], [-1, -1, 1], [-1, -1, -1],
+        ], dtype=float)
+        pure_vertices = np.hstack([np.zeros((8, 1)), cube_vertices])
+
+        # Corner positions from q, for a single q of shape (4,) or one per frame (F, 4)
+        def times_q(q):
+            return quaternion_multiply(pure_vertices, q[..., None, :])[..., 1:]
+
+        def q_times(q):
+            return quaternion_multiply(q[..., None, :], pure_vertices)[..., 1:]
+
+        def q_sandwich(q):
+            return quaternion_multiply(q[..., None, :], quaternion_multiply(pure_vertices, q[..., None, :]))[..., 1:]
+
+        def rotated(q):
+            # q * p * q' is the actual rotation, applied without building pure quaternions
+            return rotate_points(q[..., None, :], cube_vertices)
+
+        def rotations(thetas):
+            # q at every frame of a spin; axis_dot holds still while theta spins
+            return np.column_stack([np.cos(thetas), np.outer(np.sin(thetas), get_axis())])
+
+        def follow(vertex_dots, vertex_map):
+            vertex_dots.vertex_map = vertex_map
+            return vertex_dots.set_positions(lambda: vertex_map(rotation()))
+
+        def baked(*cubes):
+            # Every frame of a spin is computed up front and played back, for the
+            # vertices and for the mesh drawn from them; cubes are (vertex_dots, mesh) pairs
+            targets = []
+            for cube, mesh in cubes:
+                positions = lambda thetas, cube=cube: cube.vertex_map(rotations(thetas))
+                targets += [(cube, positions), (mesh, positions)]
+            return targets
+
+        # All eight corners come from one vectorized product per frame
+        dots = [Dot3D(color=color) for color in dot_colors]
+        cube = follow(VertexDots(dots, None), times_q)
+        scheduler.schedule(cube, lambda m: m.update_positions())
+        cube.update_positions()
+
+        # Edges and faces as index arrays into the vertex array
+        edges = [
+            [0, 1], [3, 2], [0, 2], [1, 3],
+            [4, 5], [7, 6], [4, 6], [5, 7],
+            [0, 4], [1, 5], [2, 6], [3, 7],
+        ]
         faces = [
             [0, 1, 3, 2],  # Front
             [4, 5, 7, 6],  # Back
@@ -1884,30 +1871,21 @@ class QuaternionRotations3D(ThreeDScene):
 
         # Colors for each face
         face_colors = [RED, GREEN, BLUE, YELLOW, ORANGE, PURPLE]
+        face_config = dict(stroke_opacity=0.8, fill_opacity=0.8, sheen_direction=UL, shade_in_3d=True)
 
-        # Create and add polygon faces with updaters
-        cube_faces = []
-        for i, face_indices in enumerate(faces):
-            color = face_colors[i]
-            # Initial polygon
-            face = Polygon(
-                *[dots[j].get_center() for j in face_indices],
-                color=color,
-                fill_color=color,
-                stroke_opacity=0.8,
-                fill_opacity=0.8,
-                sheen_direction=UL,
-                shade_in_3d=True
-            )
-
-            def updater(m, face_indices=face_indices):
-                # Update vertices directly, no need to rebuild Polygon
-                new_points = [dots[j].get_center() for j in face_indices]
-                m.set_points_as_corners(new_points + [new_points[0]])  # close polygon
-
-            face.add_updater(updater)
-            cube_faces.append(face)
-            self.add(face)
+        # Every edge and face follows the vertex array through indexing, no per-face updaters
+        mesh = VertexMesh(cube.current, edges, faces, edge_config=dict(color=GREY), face_colors=face_colors, face_config=face_config)
+        scheduler.schedule(mesh, lambda m: m.set_vertices(cube.current), depends_on=[cube])
+        lines = mesh.edges
+        cube_faces = mesh.faces
+        
+        self.add(scheduler)
+        self.add(cube)
+        self.add(lines)
+        
+        self.play(Write(VGroup(*dots, *lines)))
+        
+        self.add(cube_faces)
 
         # One-liner to play all creations
         self.play(Create(VGroup(*cube_faces)))
@@ -1929,21 +1907,21 @@ class QuaternionRotations3D(ThreeDScene):
         prefix = MathTex(r"q = e^{\mathbf{u} \theta} = ", font_size=50)
 
         # --- w_sign ---
-        w_sign = MathTex("+", font_size=50)
+        w_sign = SignToggle(font_size=50)
         w_val = DecimalNumber(abs(cos(theta.get_value())), num_decimal_places=2, font_size=50)
 
         # --- x_sign ---
-        x_sign = MathTex("+", font_size=50)
+        x_sign = SignToggle(font_size=50)
         x_val = DecimalNumber(abs(get_axis()[0] * sin(theta.get_value())), num_decimal_places=2, font_size=50, color="#FF3333")
         x_unit = MathTex(r"\boldsymbol{i}", font_size=50, color="#FF3333")
 
         # --- y_sign ---
-        y_sign = MathTex("+", font_size=50)
+        y_sign = SignToggle(font_size=50)
         y_val = DecimalNumber(abs(get_axis()[1] * sin(theta.get_value())), num_decimal_places=2, font_size=50, color="#9B30FF")  
         y_unit = MathTex(r"\boldsymbol{j}", font_size=50, color="#9B30FF")
 
         # --- z_sign ---
-        z_sign = MathTex("+", font_size=50)
+        z_sign = SignToggle(font_size=50)
         z_val = DecimalNumber(abs(get_axis()[2] * sin(theta.get_value())), num_decimal_places=2, font_size=50, color="#1E90FF")
         z_unit = MathTex(r"\boldsymbol{k}", font_size=50, color="#1E90FF")
 
@@ -1959,19 +1937,19 @@ class QuaternionRotations3D(ThreeDScene):
         self.add_fixed_in_frame_mobjects(text4)
         self.play(Write(text4))
 
-        w_val.add_updater(lambda m: m.set_value(abs(cos(theta.get_value()))))
-        x_val.add_updater(lambda m: m.set_value(abs(get_axis()[0] * sin(theta.get_value()))))
-        y_val.add_updater(lambda m: m.set_value(abs(get_axis()[1] * sin(theta.get_value()))))
-        z_val.add_updater(lambda m: m.set_value(abs(get_axis()[2] * sin(theta.get_value()))))
+        w_val.add_updater(lambda m: m.set_value(abs(rotation()[0])))
+        x_val.add_updater(lambda m: m.set_value(abs(rotation()[1])))
+        y_val.add_updater(lambda m: m.set_value(abs(rotation()[2])))
+        z_val.add_updater(lambda m: m.set_value(abs(rotation()[3])))
         w_val.add_updater(lambda m: self.add_fixed_in_frame_mobjects(m))
         x_val.add_updater(lambda m: self.add_fixed_in_frame_mobjects(m))
         y_val.add_updater(lambda m: self.add_fixed_in_frame_mobjects(m))
         z_val.add_updater(lambda m: self.add_fixed_in_frame_mobjects(m))
         
-        w_sign.add_updater(lambda m: m.become(MathTex("+" if cos(theta.get_value()) >= 0 else "-", font_size=50).move_to(m)))
-        x_sign.add_updater(lambda m: m.become(MathTex("+" if get_axis()[0] * sin(theta.get_value()) >= 0 else "-", font_size=50).move_to(m)))
-        y_sign.add_updater(lambda m: m.become(MathTex("+" if get_axis()[1] * sin(theta.get_value()) >= 0 else "-", font_size=50).move_to(m)))
-        z_sign.add_updater(lambda m: m.become(MathTex("+" if get_axis()[2] * sin(theta.get_value()) >= 0 else "-", font_size=50).move_to(m)))
+        w_sign.add_updater(lambda m: m.set_sign(signs[0]))
+        x_sign.add_updater(lambda m: m.set_sign(signs[1]))
+        y_sign.add_updater(lambda m: m.set_sign(signs[2]))
+        z_sign.add_updater(lambda m: m.set_sign(signs[3]))
 
 
 
@@ -1999,12 +1977,12 @@ class QuaternionRotations3D(ThreeDScene):
         
 
         
-        # Build axis text as one MathTex expression
-        axis_text = MathTex(
+        # Build axis text from cached glyphs so the updater never runs LaTeX
+        axis_text = LiveMathTex(
             r"\mathbf{u} = (",
-            rf"\textcolor[HTML]{{FF3333}}{{{get_axis()[0]:.2f}}}", ",",
-            rf"\textcolor[HTML]{{9B30FF}}{{{get_axis()[1]:.2f}}}", ",",
-            rf"\textcolor[HTML]{{1E90FF}}{{{get_axis()[2]:.2f}}}", ")",
+            LiveValue(lambda: get_axis()[0], color="#FF3333"), ",",
+            LiveValue(lambda: get_axis()[1], color="#9B30FF"), ",",
+            LiveValue(lambda: get_axis()[2], color="#1E90FF"), ")",
             font_size=50,
             tex_template=my_tex_template,
         ).move_to(LEFT * 4.4 + UP * 1)
@@ -2025,14 +2003,7 @@ class QuaternionRotations3D(ThreeDScene):
          
         line.add_updater(lambda m: self.bring_to_back(m))
                      
-        axis_text.add_updater(lambda m: m.become(MathTex(
-            r"\mathbf{u} = (",
-            rf"\textcolor[HTML]{{FF3333}}{{{get_axis()[0]:.2f}}}", ",",
-            rf"\textcolor[HTML]{{9B30FF}}{{{get_axis()[1]:.2f}}}", ",",
-            rf"\textcolor[HTML]{{1E90FF}}{{{get_axis()[2]:.2f}}}", ")",
-            font_size=50,
-            tex_template=my_tex_template,
-        ).move_to(LEFT * 4.4 + UP * 1)))
+        axis_text.add_updater(lambda m: m.refresh().move_to(LEFT * 4.4 + UP * 1))
         
         # Keep text fixed to screen
         axis_text.add_updater(lambda m: self.add_fixed_in_frame_mobjects(m))
@@ -2041,31 +2012,31 @@ class QuaternionRotations3D(ThreeDScene):
         
         self.wait(2)
 
-        with tempconfig({"disable_caching": True}):
-            # Perform the rotation animation
-            self.play(
-                theta.animate.increment_value(720 * DEGREES), #   FIRST SPIN
-                run_time=50,  # duration of the animation
-                rate_func=rate_functions.ease_in_out_sine
-            )
+        # Perform the rotation animation
+        play_tracker(
+            self, theta, 720 * DEGREES,  #   FIRST SPIN
+            run_time=50,
+            rate_func=rate_functions.ease_in_out_sine,
+            bake=baked((cube, mesh))
+        )
         
         self.wait(5)
         
         
-        trails = [
-            TracedPath(dot.get_center, stroke_color=dot.get_color(), stroke_width=2, dissipating_time=0)
-            for dot in [dot1, dot2, dot3, dot4, dot5, dot6, dot7, dot8]
-        ]
-        for trail in trails:
-            self.add(trail)
+        # All eight trails in one buffer, fed from the cube's vertex array
+        # They are scheduled after the cube, which keeps it updating while it is hidden
+        trails = MultiTracedPath(lambda: cube.current, dot_colors, stroke_width=2, max_points=4096)
+        trails.clear_updaters()
+        scheduler.schedule(trails, lambda m: m.update_path(), depends_on=[cube])
+        self.add(trails)
         
         
-        with tempconfig({"disable_caching": True}):
-            self.play(
-                theta.animate.increment_value(-360 * DEGREES),#  SECOND SPIN WITH TRAIL
-                run_time=40,
-                rate_func=rate_functions.ease_in_out_sine
-            )
+        play_tracker(
+            self, theta, -360 * DEGREES,  #  SECOND SPIN WITH TRAIL
+            run_time=40,
+            rate_func=rate_functions.ease_in_out_sine,
+            bake=baked((cube, mesh))
+        )
 
 
 
@@ -2079,67 +2050,23 @@ class QuaternionRotations3D(ThreeDScene):
         ).move_to(LEFT * 4 + UP * 3)))
         self.add_fixed_in_frame_mobjects(text)
         
-        self.play(VGroup(*trails).animate.set_stroke(color=WHITE, width=2))
+        self.play(trails.animate.set_stroke(color=WHITE, width=2))
 
 
         
-        _dot1 = Dot3D(color=dot_colors[0]).add_updater(lambda m: m.move_to(quaternion_multiply(q(dash=0), [0, 1, 1, 1])))
-        _dot2 = Dot3D(color=dot_colors[1]).add_updater(lambda m: m.move_to(quaternion_multiply(q(dash=0), [0, 1, 1, -1])))
-        _dot3 = Dot3D(color=dot_colors[2]).add_updater(lambda m: m.move_to(quaternion_multiply(q(dash=0), [0, 1, -1, 1])))
-        _dot4 = Dot3D(color=dot_colors[3]).add_updater(lambda m: m.move_to(quaternion_multiply(q(dash=0), [0, 1, -1, -1])))
-        _dot5 = Dot3D(color=dot_colors[4]).add_updater(lambda m: m.move_to(quaternion_multiply(q(dash=0), [0, -1, 1, 1])))
-        _dot6 = Dot3D(color=dot_colors[5]).add_updater(lambda m: m.move_to(quaternion_multiply(q(dash=0), [0, -1, 1, -1])))
-        _dot7 = Dot3D(color=dot_colors[6]).add_updater(lambda m: m.move_to(quaternion_multiply(q(dash=0), [0, -1, -1, 1])))
-        _dot8 = Dot3D(color=dot_colors[7]).add_updater(lambda m: m.move_to(quaternion_multiply(q(dash=0), [0, -1, -1, -1])))
-        
-        _dots = [_dot1, _dot2, _dot3, _dot4, _dot5, _dot6, _dot7, _dot8]
-    
-        for d in _dots:
-            d.update(0)
-        
-        _line1  = connect(_dot1, _dot2)
-        _line2  = connect(_dot4, _dot3)
-        _line3  = connect(_dot1, _dot3)
-        _line4  = connect(_dot2, _dot4)
-        _line5  = connect(_dot5, _dot6)
-        _line6  = connect(_dot8, _dot7)
-        _line7  = connect(_dot5, _dot7)
-        _line8  = connect(_dot6, _dot8)
-        _line9  = connect(_dot1, _dot5)
-        _line10 = connect(_dot2, _dot6)
-        _line11 = connect(_dot3, _dot7)
-        _line12 = connect(_dot4, _dot8)
-        
-        _lines = [_line1, _line2, _line3, _line4, _line5, _line6, _line7, _line8, _line9, _line10, _line11, _line12]
-        
-        self.add(*_dots)
-        self.add(*_lines)
+        _dots = [Dot3D(color=color) for color in dot_colors]
+        _cube = follow(VertexDots(_dots, None), q_times)
+        scheduler.schedule(_cube, lambda m: m.update_positions())
+        _cube.update_positions()
 
-    
-        # Create and add polygon faces with optimized updaters
-        _cube_faces = []
-        for i, face_indices in enumerate(faces):
-            color = face_colors[i]
-
-            # Create face once
-            face = Polygon(
-                *[_dots[j].get_center() for j in face_indices],
-                color=color,
-                fill_color=color,
-                stroke_opacity=0.8,
-                fill_opacity=0.8,
-                sheen_direction=UL,
-                shade_in_3d=True
-            )
-
-            def face_updater(m, face_indices=face_indices):
-                new_points = [_dots[j].get_center() for j in face_indices]
-                # Update existing polygon instead of recreating
-                m.set_points_as_corners(new_points + [new_points[0]])
-
-            face.add_updater(face_updater)
-            _cube_faces.append(face)
-            self.add(face)
+        _mesh = VertexMesh(_cube.current, edges, faces, edge_config=dict(color=GREY), face_colors=face_colors, face_config=face_config)
+        scheduler.schedule(_mesh, lambda m: m.set_vertices(_cube.current), depends_on=[_cube])
+        _lines = _mesh.edges
+        _cube_faces = _mesh.faces
+        
+        self.add(_cube)
+        self.add(_lines)
+        self.add(_cube_faces)
 
             
         
@@ -2152,12 +2079,12 @@ class QuaternionRotations3D(ThreeDScene):
                   )
 
             
-        with tempconfig({"disable_caching": True}):    
-            self.play(
-                theta.animate.increment_value(-720 * DEGREES),  # THIRD SPIN JUST _CUBE
-                run_time=50,  # duration of the animation
-                rate_func=rate_functions.ease_in_out_sine
-            )
+        play_tracker(
+            self, theta, -720 * DEGREES,  # THIRD SPIN JUST _CUBE
+            run_time=50,
+            rate_func=rate_functions.ease_in_out_sine,
+            bake=baked((cube, mesh), (_cube, _mesh))
+        )
         
         
 
@@ -2171,21 +2098,20 @@ class QuaternionRotations3D(ThreeDScene):
         
     
             
-        self.play(Write(text2), Unwrite(VGroup(*trails)))
+        self.play(Write(text2), Unwrite(trails))
+        scheduler.unschedule(trails)
         
         self.play(VGroup(*lines, *dots, *cube_faces).animate.set_opacity(100))
         
         self.wait(2)
         
-        with tempconfig({"disable_caching": True}):      
-            self.play(
-                theta.animate.increment_value(360 * DEGREES),  # FOURTH SPIN BOTH CUBES
-                run_time=50,  # duration of the animation
-                rate_func=rate_functions.ease_in_out_sine
-            )
-            
-        for mob in trails:
-            mob.clear_updaters()
+        play_tracker(
+            self, theta, 360 * DEGREES,  # FOURTH SPIN BOTH CUBES
+            run_time=50,
+            rate_func=rate_functions.ease_in_out_sine,
+            bake=baked((cube, mesh), (_cube, _mesh))
+        )
+
         
         self.wait(10)
         
@@ -2201,41 +2127,19 @@ class QuaternionRotations3D(ThreeDScene):
         self.play(VGroup(*lines, *dots, *cube_faces).animate.set_opacity(0))
         
         
-        for mob in _dots:
-            mob.clear_updaters()
-            
-          
-        _dot1.add_updater(lambda m: m.move_to(quaternion_multiply(q(dash=0), quaternion_multiply([0, 1, 1, 1], q(dash=0), w=True))))
-        _dot2.add_updater(lambda m: m.move_to(quaternion_multiply(q(dash=0), quaternion_multiply([0, 1, 1, -1], q(dash=0), w=True))))
-        _dot3.add_updater(lambda m: m.move_to(quaternion_multiply(q(dash=0), quaternion_multiply([0, 1, -1, 1], q(dash=0), w=True))))
-        _dot4.add_updater(lambda m: m.move_to(quaternion_multiply(q(dash=0), quaternion_multiply([0, 1, -1, -1], q(dash=0), w=True))))
-        _dot5.add_updater(lambda m: m.move_to(quaternion_multiply(q(dash=0), quaternion_multiply([0, -1, 1, 1], q(dash=0), w=True))))
-        _dot6.add_updater(lambda m: m.move_to(quaternion_multiply(q(dash=0), quaternion_multiply([0, -1, 1, -1], q(dash=0), w=True))))
-        _dot7.add_updater(lambda m: m.move_to(quaternion_multiply(q(dash=0), quaternion_multiply([0, -1, -1, 1], q(dash=0), w=True))))
-        _dot8.add_updater(lambda m: m.move_to(quaternion_multiply(q(dash=0), quaternion_multiply([0, -1, -1, -1], q(dash=0), w=True))))
-        
-        with tempconfig({"disable_caching": True}):
-            self.play(
-                theta.animate.increment_value(720 * DEGREES),  # FIFTH SPIN DOUBLE MULTIPLY
-                run_time=50,  # duration of the animation
-                rate_func=rate_functions.ease_in_out_sine
-            )
+        follow(_cube, q_sandwich)
+        
+        play_tracker(
+            self, theta, 720 * DEGREES,  # FIFTH SPIN DOUBLE MULTIPLY
+            run_time=50,
+            rate_func=rate_functions.ease_in_out_sine,
+            bake=baked((cube, mesh), (_cube, _mesh))
+        )
         
         
         self.wait(15)
         
-        for mob in _dots:
-            mob.clear_updaters()
-            
-          
-        _dot1.add_updater(lambda m: m.move_to(quaternion_multiply(q(dash=0), quaternion_multiply([0, 1, 1, 1], q(dash=1), w=True))))
-        _dot2.add_updater(lambda m: m.move_to(quaternion_multiply(q(dash=0), quaternion_multiply([0, 1, 1, -1], q(dash=1), w=True))))
-        _dot3.add_updater(lambda m: m.move_to(quaternion_multiply(q(dash=0), quaternion_multiply([0, 1, -1, 1], q(dash=1), w=True))))
-        _dot4.add_updater(lambda m: m.move_to(quaternion_multiply(q(dash=0), quaternion_multiply([0, 1, -1, -1], q(dash=1), w=True))))
-        _dot5.add_updater(lambda m: m.move_to(quaternion_multiply(q(dash=0), quaternion_multiply([0, -1, 1, 1], q(dash=1), w=True))))
-        _dot6.add_updater(lambda m: m.move_to(quaternion_multiply(q(dash=0), quaternion_multiply([0, -1, 1, -1], q(dash=1), w=True))))
-        _dot7.add_updater(lambda m: m.move_to(quaternion_multiply(q(dash=0), quaternion_multiply([0, -1, -1, 1], q(dash=1), w=True))))
-        _dot8.add_updater(lambda m: m.move_to(quaternion_multiply(q(dash=0), quaternion_multiply([0, -1, -1, -1], q(dash=1), w=True))))
+        follow(_cube, rotated)
         
         
         self.play(Transform(text, MathTex(
@@ -2244,42 +2148,47 @@ class QuaternionRotations3D(ThreeDScene):
         ).move_to(LEFT * 4.1 + UP * 3)))
         self.add_fixed_in_frame_mobjects(text)
         
-        with tempconfig({"disable_caching": True}):
-            self.play(
-                theta.animate.increment_value(-600 * DEGREES),  # SIXTH SPIN REAL ROTATION
-                run_time=50,  # duration of the animation
-                rate_func=rate_functions.ease_in_out_sine
-            )
+        play_tracker(
+            self, theta, -600 * DEGREES,  # SIXTH SPIN REAL ROTATION
+            run_time=50,
+            rate_func=rate_functions.ease_in_out_sine,
+            bake=baked((cube, mesh), (_cube, _mesh))
+        )
         
         self.wait(10)
 
-        with tempconfig({"disable_caching": True}):
-            self.play(
-                axis_dot.animate.move_to([0, -1, 0.6]),
-                run_time=5,
-                func_rate=linear,
-            )
-            self.play(
-                axis_dot.animate.move_to([2, 0.3, -4]),
-                run_time=5,
-                func_rate=linear,
-            )
-            self.play(
-                axis_dot.animate.move_to([0, 1, 0]),
-                run_time=5,
-                func_rate=linear,
-            )
-            self.play(
-                theta.animate.increment_value(-120 * DEGREES),  # SIXTH SPIN REAL ROTATION
-                run_time=5,  # duration of the animation
-                rate_func=rate_functions.ease_in_out_sine
-            )
+        cached_play(
+            self,
+            axis_dot.animate.move_to([0, -1, 0.6]),
+            run_time=5,
+            func_rate=linear,
+        )
+        cached_play(
+            self,
+            axis_dot.animate.move_to([2, 0.3, -4]),
+            run_time=5,
+            func_rate=linear,
+        )
+        cached_play(
+            self,
+            axis_dot.animate.move_to([0, 1, 0]),
+            run_time=5,
+            func_rate=linear,
+        )
+        play_tracker(
+            self, theta, -120 * DEGREES,  # SIXTH SPIN REAL ROTATION
+            run_time=5,
+            rate_func=rate_functions.ease_in_out_sine,
+            bake=baked((cube, mesh), (_cube, _mesh))
+        )
         
         
         self.wait(8)
             
         for mob in self.mobjects:
             mob.clear_updaters()
+        logger.info(scheduler.report())
+        self.remove(scheduler)
         
         self.wait(8)
     
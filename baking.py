@@ -0,0 +1,276 @@
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from contextlib import contextmanager
+
+import numpy as np
+
+try:
+    import fcntl
+except ImportError:
+    # Windows: index updates are atomic renames but not serialized
+    fcntl = None
+
+
+
+BAKE_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "bakes")
+BAKE_CACHE_MAX_BYTES = 2 << 30
+
+
+def tracker_values(start_value, delta, rate_func, frames):
+    """
+    Value of a tracker animated by start_value + delta * rate_func(t) at each of the
+    frames of a play, plus the value it finishes on.
+    rate_func is called once on the whole array when it vectorizes, else per frame.
+    Returns: array of shape (frames + 1,)
+    """
+    t = np.arange(frames + 1) / frames
+    try:
+        eased = np.asarray(rate_func(t), dtype=float)
+    except (TypeError, ValueError):
+        eased = None
+    if eased is None or eased.shape != t.shape:
+        eased = np.array([rate_func(x) for x in t], dtype=float)
+    return start_value + delta * eased
+
+
+def bake(positions, values):
+    """
+    Evaluate positions, a vectorized function of the tracker values, for every frame.
+    Returns: read-only array of shape (frames + 1, n_points, 3)
+    """
+    baked = np.asarray(positions(values), dtype=float)
+    if baked.ndim != 3 or baked.shape[0] != len(values) or baked.shape[2] != 3:
+        raise ValueError(f"baked positions have shape {baked.shape}, expected ({len(values)}, n_points, 3)")
+    baked.setflags(write=False)
+    return baked
+
+
+# Stands for the module's bake_cache, which is defined further down
+DEFAULT_CACHE = object()
+
+
+class Playback:
+    """
+    Drives VertexDots groups and VertexMesh objects from baked arrays for the duration
+    of one tracker play.
+    targets are (vertex_dots, positions) or (vertex_mesh, positions) pairs; a mesh gets
+    the edge and face points of every frame computed up front from its baked vertices,
+    and set_vertices() then only copies the current frame in, whatever it is passed.
+    Targets sharing a positions function share one baked array. seek(t) selects the
+    frame for the global animation time t, and restore() hands the targets back their
+    live behaviour.
+    Only these targets are baked: trails, HUD values and any other updaters still run
+    every frame, reading the baked vertices.
+    Arrays come from cache (a BakeCache, the shared on-disk one by default) unless it is None.
+    """
+
+    def __init__(self, targets, values, cache=DEFAULT_CACHE):
+        self.frame = 0
+        self.frames = len(values) - 1
+        self.arrays = []
+        self._restore = []
+        if cache is DEFAULT_CACHE:
+            cache = bake_cache
+        loaded = {}
+        for target, positions in targets:
+            if id(positions) not in loaded:
+                loaded[id(positions)] = cache.load(positions, values) if cache is not None else bake(positions, values)
+            baked = loaded[id(positions)]
+            self.arrays.append(baked)
+            if hasattr(target, "mesh_points"):
+                self._drive_mesh(target, baked)
+            else:
+                self._restore.append(lambda target=target, positions=target.positions: target.set_positions(positions))
+                target.set_positions(lambda baked=baked: baked[self.frame])
+
+    def _drive_mesh(self, mesh, baked):
+        edge_frames, face_frames = mesh.mesh_points(baked)
+
+        def set_vertices(vertices):
+            mesh.vertices = baked[self.frame]
+            return mesh.set_mesh_points(edge_frames[self.frame], face_frames[self.frame])
+
+        mesh.set_vertices = set_vertices
+        self._restore.append(lambda: delattr(mesh, "set_vertices"))
+
+    def seek(self, t):
+        self.frame = min(self.frames, max(0, int(round(t * self.frames))))
+
+    def restore(self):
+        for restore in self._restore:
+            restore()
+
+
+class BakeCache:
+    """
+    Baked arrays on disk as .npy files, memory-mapped back on a hit.
+    Entries are keyed by the bake function as the play cache hashes it (source, captured
+    constants, the project functions it calls), the tracker values of every frame and
+    the resolution and frame rate; mobjects it reaches are hashed with their whole family.
+    index.json records size, last use and hits per entry plus overall hit/miss counts;
+    the least recently used entries are evicted once the cache grows past max_bytes.
+    Several processes can share the cache: files are written under unique temporary
+    names and renamed into place, and the index is only updated under a file lock.
+    With track_hits off, hits do not touch the index at all.
+    """
+
+    def __init__(self, cache_dir=BAKE_CACHE_DIR, max_bytes=BAKE_CACHE_MAX_BYTES, track_hits=True):
+        self.cache_dir = cache_dir
+        self.max_bytes = max_bytes
+        self.track_hits = track_hits
+        self.index_path = os.path.join(cache_dir, "index.json")
+        self.lock_path = os.path.join(cache_dir, "index.lock")
+
+    @contextmanager
+    def _locked(self):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        with open(self.lock_path, "a") as f:
+            if fcntl is not None:
+                # Released when the file is closed
+                fcntl.flock(f, fcntl.LOCK_EX)
+            yield
+
+    def _read_index(self):
+        if not os.path.exists(self.index_path):
+            return {"hits": 0, "misses": 0, "entries": {}}
+        with open(self.index_path) as f:
+            return json.load(f)
+
+    def _replace(self, path, write, mode):
+        os.makedirs(self.cache_dir, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=self.cache_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, mode) as f:
+                write(f)
+            os.replace(tmp_path, path)
+        except BaseException:
+            os.remove(tmp_path)
+            raise
+
+    def _write_index(self, index):
+        self._replace(self.index_path, lambda f: json.dump(index, f, indent=1), "w")
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f"{key}.npy")
+
+    def key(self, positions, values):
+        from manim import config
+        from play_cache import digest
+
+        return digest(positions, np.asarray(values, dtype=float), [config.pixel_width, config.pixel_height, config.frame_rate])[:32]
+
+    def load(self, positions, values):
+        """
+        The baked array for positions over values, from disk when it exists.
+        Returns: read-only array of shape (frames + 1, n_points, 3)
+        """
+        key = self.key(positions, values)
+        path = self._path(key)
+        try:
+            baked = np.load(path, mmap_mode="r")
+            hit = True
+        except FileNotFoundError:
+            # Baked outside the lock; processes missing the same key write identical files
+            baked = bake(positions, values)
+            self._replace(path, lambda f: np.save(f, baked), "wb")
+            hit = False
+        if hit and not self.track_hits:
+            return baked
+
+        with self._locked():
+            if not os.path.exists(path):
+                # Evicted by another process since it was loaded or written
+                self._replace(path, lambda f: np.save(f, baked), "wb")
+            index = self._read_index()
+            entry = index["entries"].get(key)
+            if entry is None:
+                entry = index["entries"][key] = {"bytes": os.path.getsize(path), "shape": list(baked.shape), "hits": 0}
+            if hit:
+                index["hits"] += 1
+                entry["hits"] += 1
+            else:
+                index["misses"] += 1
+            entry["last_used"] = time.time()
+            self._evict(index, keep=key)
+            self._write_index(index)
+        return baked
+
+    def _evict(self, index, keep=None):
+        entries = index["entries"]
+        total = sum(entry["bytes"] for entry in entries.values())
+        for key in sorted(entries, key=lambda key: entries[key]["last_used"]):
+            if total <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            total -= entries.pop(key)["bytes"]
+            if os.path.exists(self._path(key)):
+                os.remove(self._path(key))
+
+    def entries(self):
+        """
+        Returns: {key: entry} from the index, least recently used first
+        """
+        with self._locked():
+            entries = self._read_index()["entries"]
+        return dict(sorted(entries.items(), key=lambda item: item[1]["last_used"]))
+
+    def purge(self, keys=None):
+        """
+        Remove the given entries, or every entry; hit/miss counts are kept.
+        Returns: number of entries removed
+        """
+        with self._locked():
+            index = self._read_index()
+            keys = list(index["entries"]) if keys is None else [key for key in keys if key in index["entries"]]
+            for key in keys:
+                del index["entries"][key]
+                if os.path.exists(self._path(key)):
+                    os.remove(self._path(key))
+            self._write_index(index)
+        return len(keys)
+
+    def stats(self):
+        with self._locked():
+            index = self._read_index()
+        lookups = index["hits"] + index["misses"]
+        return {
+            "entries": len(index["entries"]),
+            "bytes": sum(entry["bytes"] for entry in index["entries"].values()),
+            "max_bytes": self.max_bytes,
+            "hits": index["hits"],
+            "misses": index["misses"],
+            "hit_rate": index["hits"] / lookups if lookups else 0.0,
+        }
+
+
+bake_cache = BakeCache()
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Inspect or purge the on-disk cache of baked animation arrays.")
+    commands = parser.add_subparsers(dest="command", required=True)
+    commands.add_parser("list", help="entries, least recently used first")
+    purge = commands.add_parser("purge", help="remove entries (all of them if no key is given)")
+    purge.add_argument("keys", nargs="*")
+    commands.add_parser("stats", help="size and hit/miss counts")
+    args = parser.parse_args(argv)
+
+    if args.command == "list":
+        for key, entry in bake_cache.entries().items():
+            last_used = time.strftime("%Y-%m-%d %H:%M:%S", time.localtime(entry["last_used"]))
+            print(f"{key}  {tuple(entry['shape'])}  {entry['bytes'] / 2**20:.1f} MiB  {entry['hits']} hits  last used {last_used}")
+    elif args.command == "purge":
+        print(f"Removed {bake_cache.purge(args.keys or None)} entries")
+    else:
+        for name, value in bake_cache.stats().items():
+            print(f"{name}: {value}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,183 @@
+import argparse
+import importlib.util
+import inspect
+import json
+import multiprocessing
+import os
+import shutil
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import contextmanager
+
+
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+MODULES = ["Quaternions.py", "Quaternions-part-II.py"]
+SUMMARY_PATH = os.path.join(ROOT, "media", "batch_render.json")
+QUALITIES = {
+    "l": "low_quality",
+    "m": "medium_quality",
+    "h": "high_quality",
+    "p": "production_quality",
+    "k": "fourk_quality",
+}
+
+
+def load_module(path):
+    """
+    Import a scene file by path; the file names are not valid module names.
+    """
+    path = os.path.abspath(path)
+    directory = os.path.dirname(path)
+    if directory not in sys.path:
+        # manim does the same, so the scene files can import their siblings
+        sys.path.insert(0, directory)
+    name = os.path.splitext(os.path.basename(path))[0].replace("-", "_")
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    # inspect finds the source of the scene classes through sys.modules
+    sys.modules[spec.name] = module
+    spec.loader.exec_module(module)
+    return module
+
+
+@contextmanager
+def private_tex_dir(name):
+    """
+    Point manim's tex_dir at a directory of this worker's own, seeded with the files of
+    the shared one. manim only checks that a .tex/.dvi/.svg exists before using it, so
+    workers typesetting the same string in one directory could read each other's
+    half-written files. Whatever was typeset here is moved into the shared directory
+    afterwards, one rename per file, for the next render to reuse.
+    Use inside the tempconfig of the render.
+    """
+    from manim import config
+
+    shared = config.get_dir("tex_dir")
+    private = os.path.join(f"{shared}_workers", name)
+    os.makedirs(shared, exist_ok=True)
+    shutil.rmtree(private, ignore_errors=True)
+    os.makedirs(private)
+    for entry in os.scandir(shared):
+        if entry.is_file():
+            shutil.copy2(entry.path, private)
+    config.tex_dir = private
+    try:
+        yield private
+    finally:
+        config.tex_dir = shared
+        for entry in os.scandir(private):
+            if entry.is_file() and not os.path.exists(os.path.join(shared, entry.name)):
+                os.replace(entry.path, os.path.join(shared, entry.name))
+        shutil.rmtree(private, ignore_errors=True)
+
+
+def discover_scenes(path):
+    """
+    Scene subclasses defined in the file itself, in source order.
+    Returns: list of (scene name, source length) pairs
+    """
+    from manim import Scene
+
+    module = load_module(path)
+    scenes = [
+        obj for obj in vars(module).values()
+        if inspect.isclass(obj) and issubclass(obj, Scene) and obj.__module__ == module.__name__
+    ]
+    scenes.sort(key=lambda scene: inspect.getsourcelines(scene)[1])
+    return [(scene.__name__, len(inspect.getsource(scene))) for scene in scenes]
+
+
+def render_scene(path, scene_name, quality):
+    """
+    Render one scene in this process.
+    Returns: summary dict with wall time, frames and the output path (or the error)
+    """
+    from manim import config, tempconfig
+
+    result = {"module": os.path.basename(path), "scene": scene_name}
+    start = time.perf_counter()
+    try:
+        scene_class = getattr(load_module(path), scene_name)
+        with tempconfig({"quality": quality, "input_file": os.path.abspath(path)}), private_tex_dir(f"{scene_name}_{os.getpid()}"):
+            scene = scene_class()
+            scene.render()
+            result["frames"] = round(scene.renderer.time * config.frame_rate)
+            result["output"] = str(scene.renderer.file_writer.movie_file_path)
+    except Exception:
+        result["error"] = traceback.format_exc()
+    result["wall_time"] = time.perf_counter() - start
+    return result
+
+
+def load_timings(summary_path):
+    if not os.path.exists(summary_path):
+        return {}
+    with open(summary_path) as f:
+        summary = json.load(f)
+    return {
+        (entry["module"], entry["scene"]): entry["wall_time"]
+        for entry in summary["scenes"]
+        if "error" not in entry
+    }
+
+
+def schedule(jobs, timings):
+    """
+    Longest expected first, so the long 3D scenes do not start last and leave the
+    pool idle. Scenes rendered before are ordered by their previous wall time; new
+    ones by source length, ahead of any timed scene.
+    """
+    def expected(job):
+        path, scene_name, source_length = job
+        timing = timings.get((os.path.basename(path), scene_name))
+        return (0, timing) if timing is not None else (1, source_length)
+
+    return sorted(jobs, key=expected, reverse=True)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render every scene of the given files in a process pool.")
+    parser.add_argument("modules", nargs="*", default=[os.path.join(ROOT, module) for module in MODULES])
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITIES), default="h")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count())
+    parser.add_argument("-s", "--scenes", nargs="+", help="only render these scene names")
+    parser.add_argument("--summary", default=SUMMARY_PATH)
+    args = parser.parse_args(argv)
+
+    jobs = []
+    for path in args.modules:
+        for scene_name, source_length in discover_scenes(path):
+            if args.scenes is None or scene_name in args.scenes:
+                jobs.append((path, scene_name, source_length))
+    jobs = schedule(jobs, load_timings(args.summary))
+
+    start = time.perf_counter()
+    results = []
+    # Fresh interpreters, so no manim config or scene state leaks between renders
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=args.jobs, mp_context=context) as pool:
+        futures = [pool.submit(render_scene, path, scene_name, QUALITIES[args.quality]) for path, scene_name, _ in jobs]
+        for future in as_completed(futures):
+            result = future.result()
+            results.append(result)
+            status = "failed" if "error" in result else f"{result['frames']} frames"
+            print(f"{result['module']}:{result['scene']} {status} in {result['wall_time']:.1f}s")
+
+    summary = {
+        "quality": QUALITIES[args.quality],
+        "jobs": args.jobs,
+        "wall_time": time.perf_counter() - start,
+        "scenes": sorted(results, key=lambda result: (result["module"], result["scene"])),
+    }
+    os.makedirs(os.path.dirname(os.path.abspath(args.summary)), exist_ok=True)
+    with open(args.summary, "w") as f:
+        json.dump(summary, f, indent=1)
+    print(f"Rendered {len(results)} scenes in {summary['wall_time']:.1f}s, summary in {args.summary}")
+    return 1 if any("error" in result for result in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
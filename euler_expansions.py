@@ -0,0 +1,164 @@
+import hashlib
+import json
+import os
+
+
+
+ORDERS = [
+    'XYZ', 'ZYX', 'YZX', 'XZY', 'YXZ', 'ZXY',
+    'ZYZ', 'XYX', 'YXY', 'XZX', 'ZXZ', 'YZY'
+]
+
+CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".cache", "euler_expansions")
+
+
+def source_hash():
+    """
+    Hash of this module's source; any change to the expansion code invalidates the cache.
+    """
+    with open(os.path.abspath(__file__), "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()[:16]
+
+
+def euler_to_quaternion(order, A, B):
+    return [
+            [
+                [B[axis], A[axis], 0, 0],
+                [B[axis], 0, A[axis], 0],
+                [B[axis], 0, 0, A[axis]],
+                ][['X', 'Y', 'Z'].index(order[axis])]
+            for axis in range(3)
+        ]
+
+
+def quaternion_multiply(q1, q2):
+    w1, x1, y1, z1 = q1
+    w2, x2, y2, z2 = q2
+    return [
+        w1*w2 - x1*x2 - y1*y2 - z1*z2,
+        w1*x2 + x1*w2 + y1*z2 - z1*y2,
+        w1*y2 - x1*z2 + y1*w2 + z1*x2,
+        w1*z2 + x1*y2 - y1*x2 + z1*w2
+    ]
+
+
+def expand(order):
+    """
+    Symbolic quaternion q3 * q2 * q1 for an Euler order, in terms of
+    A_i = sin(angle_i / 2) and B_i = cos(angle_i / 2).
+    Returns: [w, x, y, z] sympy expressions
+    """
+    import sympy as sp
+
+    A = sp.symbols('A1 A2 A3')
+    B = sp.symbols('B1 B2 B3')
+    q1, q2, q3 = euler_to_quaternion(order, A, B)
+    return quaternion_multiply(quaternion_multiply(q3, q2), q1)
+
+
+def _latex_term(term):
+    factors = sorted(term.args if term.is_Mul else [term], key=str)
+    return " ".join(f"{factor.name[0]}_{factor.name[1:]}" for factor in factors)
+
+
+def latex_lines(quaternion):
+    """
+    MathTex lines for an expanded quaternion, in the layout used by YXZQuaternionExpansion:
+    positive terms first (the all-cosine term leading), one line per component.
+    """
+    lines = []
+    for i, component in enumerate(quaternion):
+        positive, negative = [], []
+        for term in component.as_ordered_terms():
+            coefficient, product = term.as_coeff_Mul()
+            (negative if coefficient < 0 else positive).append(_latex_term(product))
+        positive.sort(key=lambda term: "A" in term)
+        body = " - ".join([" + ".join(positive)] + negative)
+        unit = ["", r" \,i", r" \,j", r" \,k"][i]
+        end = "" if i == 3 else r" \\"
+        lines.append(("  = & (" if i == 0 else "  + & (") + body + ")" + unit + end)
+    return lines
+
+
+def kernel_source(order, quaternion):
+    """
+    Python source of a NumPy kernel computing the quaternions of one order from (..., 3) angles.
+    Common products are pulled out with cse and every half-angle sin/cos (the A_i/B_i symbols)
+    is evaluated once per call.
+    """
+    import sympy as sp
+
+    substitutions, components = sp.cse(quaternion, symbols=sp.numbered_symbols('t'))
+    lines = [
+        f"def euler_{order.lower()}(angles, out=None):",
+        '    """',
+        f"    Quaternions for Euler order {order}: q = q_{order[2].lower()} q_{order[1].lower()} q_{order[0].lower()}",
+        f"    angles has shape (..., 3), angles[..., i] is the rotation about axis '{order}'[i]",
+        "    Returns: array of shape (..., 4)",
+        '    """',
+        "    angles = np.asarray(angles, dtype=float)",
+        "    A = np.sin(0.5 * angles)",
+        "    B = np.cos(0.5 * angles)",
+        "    A1, A2, A3 = A[..., 0], A[..., 1], A[..., 2]",
+        "    B1, B2, B3 = B[..., 0], B[..., 1], B[..., 2]",
+    ]
+    lines += [f"    {symbol} = {expression}" for symbol, expression in substitutions]
+    lines += [
+        "    if out is None:",
+        "        out = np.empty(angles.shape[:-1] + (4,))",
+    ]
+    lines += [f"    out[..., {i}] = {component}" for i, component in enumerate(components)]
+    lines += ["    return out"]
+    return "\n".join(lines)
+
+
+def kernels_module_source(quaternions):
+    kernels = [
+        '# Generated by "Euler to Quaternion equation generator.py" - do not edit by hand.',
+        "",
+        "import numpy as np",
+    ]
+    for order, quaternion in quaternions.items():
+        kernels += ["", "", kernel_source(order, quaternion)]
+    kernels += ["", "", "KERNELS = {"]
+    kernels += [f'    "{order}": euler_{order.lower()},' for order in quaternions]
+    kernels += ["}", ""]
+    return "\n".join(kernels)
+
+
+def build_expansions():
+    """
+    Runs the symbolic expansion for every order.
+    Returns: the JSON-serialisable dict stored in the cache
+    """
+    quaternions = {order: expand(order) for order in ORDERS}
+    return {
+        "hash": source_hash(),
+        "orders": {
+            order: {
+                "expressions": [str(component) for component in quaternion],
+                "latex": latex_lines(quaternion),
+            }
+            for order, quaternion in quaternions.items()
+        },
+        "kernels": kernels_module_source(quaternions),
+    }
+
+
+def load_expansions(cache_dir=CACHE_DIR):
+    """
+    Expanded expressions, LaTeX lines and kernel source for all orders.
+    Served from a JSON file named after the source hash; sympy only runs on a cold cache.
+    """
+    path = os.path.join(cache_dir, f"{source_hash()}.json")
+    if os.path.exists(path):
+        with open(path) as f:
+            return json.load(f)
+
+    expansions = build_expansions()
+    os.makedirs(cache_dir, exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump(expansions, f, indent=1)
+    os.replace(tmp_path, path)
+    return expansions
@@ -0,0 +1,290 @@
+# Generated by "Euler to Quaternion equation generator.py" - do not edit by hand.
+
+import numpy as np
+
+
+def euler_xyz(angles, out=None):
+    """
+    Quaternions for Euler order XYZ: q = q_z q_y q_x
+    angles has shape (..., 3), angles[..., i] is the rotation about axis 'XYZ'[i]
+    Returns: array of shape (..., 4)
+    """
+    angles = np.asarray(angles, dtype=float)
+    A = np.sin(0.5 * angles)
+    B = np.cos(0.5 * angles)
+    A1, A2, A3 = A[..., 0], A[..., 1], A[..., 2]
+    B1, B2, B3 = B[..., 0], B[..., 1], B[..., 2]
+    t0 = A2*A3
+    t1 = B2*B3
+    t2 = A2*B3
+    if out is None:
+        out = np.empty(angles.shape[:-1] + (4,))
+    out[..., 0] = A1*t0 + B1*t1
+    out[..., 1] = A1*t1 - B1*t0
+    out[..., 2] = A1*A3*B2 + B1*t2
+    out[..., 3] = -A1*t2 + A3*B1*B2
+    return out
+
+
+def euler_zyx(angles, out=None):
+    """
+    Quaternions for Euler order ZYX: q = q_x q_y q_z
+    angles has shape (..., 3), angles[..., i] is the rotation about axis 'ZYX'[i]
+    Returns: array of shape (..., 4)
+    """
+    angles = np.asarray(angles, dtype=float)
+    A = np.sin(0.5 * angles)
+    B = np.cos(0.5 * angles)
+    A1, A2, A3 = A[..., 0], A[..., 1], A[..., 2]
+    B1, B2, B3 = B[..., 0], B[..., 1], B[..., 2]
+    t0 = A1*A2
+    t1 = A1*B2
+    if out is None:
+        out = np.empty(angles.shape[:-1] + (4,))
+    out[..., 0] = -A3*t0 + B1*B2*B3
+    out[..., 1] = A3*B1*B2 + B3*t0
+    out[..., 2] = A2*B1*B3 - A3*t1
+    out[..., 3] = A2*A3*B1 + B3*t1
+    return out
+
+
+def euler_yzx(angles, out=None):
+    """
+    Quaternions for Euler order YZX: q = q_x q_z q_y
+    angles has shape (..., 3), angles[..., i] is the rotation about axis 'YZX'[i]
+    Returns: array of shape (..., 4)
+    """
+    angles = np.asarray(angles, dtype=float)
+    A = np.sin(0.5 * angles)
+    B = np.cos(0.5 * angles)
+    A1, A2, A3 = A[..., 0], A[..., 1], A[..., 2]
+    B1, B2, B3 = B[..., 0], B[..., 1], B[..., 2]
+    t0 = A1*A2
+    t1 = A1*B2
+    t2 = A2*B1
+    if out is None:
+        out = np.empty(angles.shape[:-1] + (4,))
+    out[..., 0] = A3*t0 + B1*B2*B3
+    out[..., 1] = A3*B1*B2 - B3*t0
+    out[..., 2] = -A3*t2 + B3*t1
+    out[..., 3] = A3*t1 + B3*t2
+    return out
+
+
+def euler_xzy(angles, out=None):
+    """
+    Quaternions for Euler order XZY: q = q_y q_z q_x
+    angles has shape (..., 3), angles[..., i] is the rotation about axis 'XZY'[i]
+    Returns: array of shape (..., 4)
+    """
+    angles = np.asarray(angles, dtype=float)
+    A = np.sin(0.5 * angles)
+    B = np.cos(0.5 * angles)
+    A1, A2, A3 = A[..., 0], A[..., 1], A[..., 2]
+    B1, B2, B3 = B[..., 0], B[..., 1], B[..., 2]
+    t0 = A2*A3
+    t1 = A3*B2
+    if out is None:
+        out = np.empty(angles.shape[:-1] + (4,))
+    out[..., 0] = -A1*t0 + B1*B2*B3
+    out[..., 1] = A1*B2*B3 + B1*t0
+    out[..., 2] = A1*A2*B3 + B1*t1
+    out[..., 3] = -A1*t1 + A2*B1*B3
+    return out
+
+
+def euler_yxz(angles, out=None):
+    """
+    Quaternions for Euler order YXZ: q = q_z q_x q_y
+    angles has shape (..., 3), angles[..., i] is the rotation about axis 'YXZ'[i]
+    Returns: array of shape (..., 4)
+    """
+    angles = np.asarray(angles, dtype=float)
+    A = np.sin(0.5 * angles)
+    B = np.cos(0.5 * angles)
+    A1, A2, A3 = A[..., 0], A[..., 1], A[..., 2]
+    B1, B2, B3 = B[..., 0], B[..., 1], B[..., 2]
+    t0 = A1*A3
+    t1 = A1*B3
+    t2 = A3*B1
+    if out is None:
+        out = np.empty(angles.shape[:-1] + (4,))
+    out[..., 0] = -A2*t0 + B1*B2*B3
+    out[..., 1] = A2*B1*B3 - B2*t0
+    out[..., 2] = A2*t2 + B2*t1
+    out[..., 3] = A2*t1 + B2*t2
+    return out
+
+
+def euler_zxy(angles, out=None):
+    """
+    Quaternions for Euler order ZXY: q = q_y q_x q_z
+    angles has shape (..., 3), angles[..., i] is the rotation about axis 'ZXY'[i]
+    Returns: array of shape (..., 4)
+    """
+    angles = np.asarray(angles, dtype=float)
+    A = np.sin(0.5 * angles)
+    B = np.cos(0.5 * angles)
+    A1, A2, A3 = A[..., 0], A[..., 1], A[..., 2]
+    B1, B2, B3 = B[..., 0], B[..., 1], B[..., 2]
+    t0 = A1*A3
+    t1 = B1*B3
+    t2 = A1*B3
+    if out is None:
+        out = np.empty(angles.shape[:-1] + (4,))
+    out[..., 0] = A2*t0 + B2*t1
+    out[..., 1] = A2*t1 + B2*t0
+    out[..., 2] = -A2*t2 + A3*B1*B2
+    out[..., 3] = -A2*A3*B1 + B2*t2
+    return out
+
+
+def euler_zyz(angles, out=None):
+    """
+    Quaternions for Euler order ZYZ: q = q_z q_y q_z
+    angles has shape (..., 3), angles[..., i] is the rotation about axis 'ZYZ'[i]
+    Returns: array of shape (..., 4)
+    """
+    angles = np.asarray(angles, dtype=float)
+    A = np.sin(0.5 * angles)
+    B = np.cos(0.5 * angles)
+    A1, A2, A3 = A[..., 0], A[..., 1], A[..., 2]
+    B1, B2, B3 = B[..., 0], B[..., 1], B[..., 2]
+    t0 = A1*A3
+    t1 = A1*B3
+    t2 = A3*B1
+    if out is None:
+        out = np.empty(angles.shape[:-1] + (4,))
+    out[..., 0] = B1*B2*B3 - B2*t0
+    out[..., 1] = A2*t1 - A2*t2
+    out[..., 2] = A2*B1*B3 + A2*t0
+    out[..., 3] = B2*t1 + B2*t2
+    return out
+
+
+def euler_xyx(angles, out=None):
+    """
+    Quaternions for Euler order XYX: q = q_x q_y q_x
+    angles has shape (..., 3), angles[..., i] is the rotation about axis 'XYX'[i]
+    Returns: array of shape (..., 4)
+    """
+    angles = np.asarray(angles, dtype=float)
+    A = np.sin(0.5 * angles)
+    B = np.cos(0.5 * angles)
+    A1, A2, A3 = A[..., 0], A[..., 1], A[..., 2]
+    B1, B2, B3 = B[..., 0], B[..., 1], B[..., 2]
+    t0 = A3*B2
+    t1 = A2*B3
+    if out is None:
+        out = np.empty(angles.shape[:-1] + (4,))
+    out[..., 0] = -A1*t0 + B1*B2*B3
+    out[..., 1] = A1*B2*B3 + B1*t0
+    out[..., 2] = A1*A2*A3 + B1*t1
+    out[..., 3] = -A1*t1 + A2*A3*B1
+    return out
+
+
+def euler_yxy(angles, out=None):
+    """
+    Quaternions for Euler order YXY: q = q_y q_x q_y
+    angles has shape (..., 3), angles[..., i] is the rotation about axis 'YXY'[i]
+    Returns: array of shape (..., 4)
+    """
+    angles = np.asarray(angles, dtype=float)
+    A = np.sin(0.5 * angles)
+    B = np.cos(0.5 * angles)
+    A1, A2, A3 = A[..., 0], A[..., 1], A[..., 2]
+    B1, B2, B3 = B[..., 0], B[..., 1], B[..., 2]
+    t0 = A1*A3
+    t1 = A1*B3
+    t2 = A3*B1
+    if out is None:
+        out = np.empty(angles.shape[:-1] + (4,))
+    out[..., 0] = B1*B2*B3 - B2*t0
+    out[..., 1] = A2*B1*B3 + A2*t0
+    out[..., 2] = B2*t1 + B2*t2
+    out[..., 3] = A2*t1 - A2*t2
+    return out
+
+
+def euler_xzx(angles, out=None):
+    """
+    Quaternions for Euler order XZX: q = q_x q_z q_x
+    angles has shape (..., 3), angles[..., i] is the rotation about axis 'XZX'[i]
+    Returns: array of shape (..., 4)
+    """
+    angles = np.asarray(angles, dtype=float)
+    A = np.sin(0.5 * angles)
+    B = np.cos(0.5 * angles)
+    A1, A2, A3 = A[..., 0], A[..., 1], A[..., 2]
+    B1, B2, B3 = B[..., 0], B[..., 1], B[..., 2]
+    t0 = A3*B2
+    t1 = A1*A2
+    t2 = A2*B1
+    if out is None:
+        out = np.empty(angles.shape[:-1] + (4,))
+    out[..., 0] = -A1*t0 + B1*B2*B3
+    out[..., 1] = A1*B2*B3 + B1*t0
+    out[..., 2] = -A3*t2 + B3*t1
+    out[..., 3] = A3*t1 + B3*t2
+    return out
+
+
+def euler_zxz(angles, out=None):
+    """
+    Quaternions for Euler order ZXZ: q = q_z q_x q_z
+    angles has shape (..., 3), angles[..., i] is the rotation about axis 'ZXZ'[i]
+    Returns: array of shape (..., 4)
+    """
+    angles = np.asarray(angles, dtype=float)
+    A = np.sin(0.5 * angles)
+    B = np.cos(0.5 * angles)
+    A1, A2, A3 = A[..., 0], A[..., 1], A[..., 2]
+    B1, B2, B3 = B[..., 0], B[..., 1], B[..., 2]
+    t0 = A1*A3
+    t1 = A1*B3
+    if out is None:
+        out = np.empty(angles.shape[:-1] + (4,))
+    out[..., 0] = B1*B2*B3 - B2*t0
+    out[..., 1] = A2*B1*B3 + A2*t0
+    out[..., 2] = A2*A3*B1 - A2*t1
+    out[..., 3] = A3*B1*B2 + B2*t1
+    return out
+
+
+def euler_yzy(angles, out=None):
+    """
+    Quaternions for Euler order YZY: q = q_y q_z q_y
+    angles has shape (..., 3), angles[..., i] is the rotation about axis 'YZY'[i]
+    Returns: array of shape (..., 4)
+    """
+    angles = np.asarray(angles, dtype=float)
+    A = np.sin(0.5 * angles)
+    B = np.cos(0.5 * angles)
+    A1, A2, A3 = A[..., 0], A[..., 1], A[..., 2]
+    B1, B2, B3 = B[..., 0], B[..., 1], B[..., 2]
+    t0 = A3*B2
+    t1 = A2*B3
+    if out is None:
+        out = np.empty(angles.shape[:-1] + (4,))
+    out[..., 0] = -A1*t0 + B1*B2*B3
+    out[..., 1] = -A1*t1 + A2*A3*B1
+    out[..., 2] = A1*B2*B3 + B1*t0
+    out[..., 3] = A1*A2*A3 + B1*t1
+    return out
+
+
+KERNELS = {
+    "XYZ": euler_xyz,
+    "ZYX": euler_zyx,
+    "YZX": euler_yzx,
+    "XZY": euler_xzy,
+    "YXZ": euler_yxz,
+    "ZXY": euler_zxy,
+    "ZYZ": euler_zyz,
+    "XYX": euler_xyx,
+    "YXY": euler_yxy,
+    "XZX": euler_xzx,
+    "ZXZ": euler_zxz,
+    "YZY": euler_yzy,
+}
@@ -0,0 +1,491 @@
+from collections import namedtuple
+
+import numpy as np
+from manim import DEFAULT_FONT_SIZE, OUT, WHITE, Group, Line3D, MathTex, VGroup, VMobject
+
+from quaternion_math import align_vectors, to_matrix
+
+
+
+Glyph = namedtuple("Glyph", ["points", "width"])
+
+
+class GlyphCache:
+    """
+    Typesets each TeX fragment once per (font_size, tex_template) and keeps its outline.
+    Points are stored relative to the left edge and the baseline of a reference "0",
+    so glyphs typeset on their own still line up when placed side by side.
+    """
+
+    def __init__(self):
+        self._glyphs = {}
+        self.renders = 0
+        self.hits = 0
+
+    def get(self, tex, font_size=DEFAULT_FONT_SIZE, tex_template=None):
+        key = (tex, font_size, id(tex_template))
+        glyph = self._glyphs.get(key)
+        if glyph is not None:
+            self.hits += 1
+            return glyph[0]
+
+        self.renders += 1
+        reference = MathTex("0", tex, font_size=font_size, tex_template=tex_template)
+        zero, body = reference[0], reference[1]
+        origin = np.array([body.get_left()[0], zero.get_bottom()[1], 0])
+        points = np.vstack([m.points for m in body.family_members_with_points()]) - origin
+        points.setflags(write=False)
+        glyph = Glyph(points, body.width)
+        # Keep the template alive so its id cannot be reused by another one
+        self._glyphs[key] = (glyph, tex_template)
+        return glyph
+
+
+glyph_cache = GlyphCache()
+
+
+class LiveValue:
+    """
+    A slot of a LiveMathTex that is re-formatted from get_value() every refresh.
+    fmt is a format string or a function value -> str; color defaults to the formula's.
+    """
+
+    def __init__(self, get_value, fmt="{:.2f}", color=None, max_chars=8):
+        self.get_value = get_value
+        self.fmt = fmt
+        self.color = color
+        self.max_chars = max_chars
+
+    def format(self):
+        value = self.get_value()
+        text = self.fmt(value) if callable(self.fmt) else self.fmt.format(value)
+        if len(text) > self.max_chars:
+            raise ValueError(f"{text!r} is longer than max_chars={self.max_chars}")
+        return text
+
+
+class LiveMathTex(VGroup):
+    """
+    Formula made of fixed TeX fragments and LiveValue slots, drawn from cached glyphs.
+    Only the glyph cache ever runs LaTeX: refresh() re-formats the slots and, when the
+    text changed, copies cached outlines into submobjects that were allocated up front.
+    Parts are TeX strings, (tex, color) pairs or LiveValues.
+    """
+
+    piece_buff_per_font_unit = 0.002
+    char_buff_per_font_unit = 0.001
+
+    def __init__(self, *parts, font_size=DEFAULT_FONT_SIZE, color=WHITE, tex_template=None, **kwargs):
+        super().__init__(**kwargs)
+        self.font_size = font_size
+        self.tex_template = tex_template
+        self.piece_buff = self.piece_buff_per_font_unit * font_size
+        self.char_buff = self.char_buff_per_font_unit * font_size
+
+        self._pieces = []
+        self._slots = []
+        for part in parts:
+            if isinstance(part, LiveValue):
+                chars = [self._new_glyph_mobject(part.color or color) for _ in range(part.max_chars)]
+                self._pieces.append((part, chars))
+                self._slots.append(part)
+                self.add(*chars)
+            else:
+                tex, part_color = part if isinstance(part, tuple) else (part, color)
+                mob = self._new_glyph_mobject(part_color)
+                self._pieces.append((self._glyph(tex), mob))
+                self.add(mob)
+
+        self._texts = [slot.format() for slot in self._slots]
+        # The first layout happens around the origin, like any other MathTex
+        self._layout()
+
+    @staticmethod
+    def _new_glyph_mobject(color):
+        return VMobject(fill_color=color, fill_opacity=1.0, stroke_width=0)
+
+    def _glyph(self, tex):
+        return glyph_cache.get(tex, self.font_size, self.tex_template)
+
+    def refresh(self):
+        """
+        Re-format every slot; the layout is only touched if some text changed.
+        """
+        changed = False
+        for i, slot in enumerate(self._slots):
+            text = slot.format()
+            if text != self._texts[i]:
+                self._texts[i] = text
+                changed = True
+        if changed:
+            self._layout()
+        return self
+
+    def _layout(self):
+        center = self.get_center()
+        texts = iter(self._texts)
+        x = 0
+        for piece, mobs in self._pieces:
+            if isinstance(piece, Glyph):
+                mobs.set_points(piece.points + (x, 0, 0))
+                x += piece.width + self.piece_buff
+                continue
+
+            text = next(texts)
+            for i, mob in enumerate(mobs):
+                if i < len(text):
+                    glyph = self._glyph(text[i])
+                    mob.set_points(glyph.points + (x, 0, 0))
+                    x += glyph.width + self.char_buff
+                else:
+                    # Unused characters collapse to a single point so the family never changes
+                    mob.set_points(np.repeat([[x, 0, 0]], 4, axis=0))
+            x += self.piece_buff - self.char_buff
+
+        self.move_to(center)
+
+
+class TexToggle(VMobject):
+    """
+    Switches in place between pre-typeset variants, e.g. "+" and "-".
+    set_state() returns straight away unless the state changes; only then are the
+    points swapped, centred where the previous variant was.
+    """
+
+    def __init__(self, *variants, state=0, font_size=DEFAULT_FONT_SIZE, color=WHITE, tex_template=None, **kwargs):
+        super().__init__(fill_color=color, fill_opacity=1.0, stroke_width=0, **kwargs)
+        self.variants = [glyph_cache.get(tex, font_size, tex_template).points for tex in variants]
+        self._centers = [(points.min(axis=0) + points.max(axis=0)) / 2 for points in self.variants]
+        self.state = state
+        self.set_points(self.variants[state] - self._centers[state])
+
+    def set_state(self, state):
+        if state == self.state:
+            return self
+        center = self.get_center()
+        self.set_points(self.variants[state] + (center - self._centers[state]))
+        self.state = state
+        return self
+
+
+class SignToggle(TexToggle):
+    """
+    TexToggle between "+" and "-", driven by the sign of a value.
+    """
+
+    def __init__(self, positive="+", negative="-", **kwargs):
+        super().__init__(positive, negative, **kwargs)
+
+    def set_sign(self, value):
+        return self.set_state(0 if value >= 0 else 1)
+
+
+class VertexDots(Group):
+    """
+    Dots placed from a single (N, 3) array.
+    positions is a function returning that array, typically one vectorized rotation of
+    the base vertices; update_positions() calls it once and moves every dot, so the
+    rotation is evaluated once per frame however many dots there are.
+    """
+
+    def __init__(self, dots, positions, **kwargs):
+        super().__init__(*dots, **kwargs)
+        self.positions = positions
+        self.current = None
+
+    def set_positions(self, positions):
+        self.positions = positions
+        return self
+
+    def update_positions(self):
+        points = np.asarray(self.positions(), dtype=float)
+        if points.shape != (len(self.submobjects), 3):
+            raise ValueError(f"positions returned shape {points.shape}, expected ({len(self.submobjects)}, 3)")
+        self.current = points
+        for dot, point in zip(self.submobjects, points):
+            dot.move_to(point)
+        return self
+
+
+class PosableLine3D(Line3D):
+    """
+    Line3D that is re-posed instead of rebuilt.
+    The cylinder mesh is generated once, unit length along +z around the origin;
+    put_start_and_end_on() rotates, stretches and shifts those cached points into place
+    with one matrix product, and returns straight away when the endpoints did not move.
+    """
+
+    def __init__(self, start, end, **kwargs):
+        super().__init__(start=-0.5 * OUT, end=0.5 * OUT, **kwargs)
+        members = self.family_members_with_points()
+        self._rest = np.vstack([m.points for m in members])
+        self._sizes = [len(m.points) for m in members]
+        self._pose = None
+        self.put_start_and_end_on(start, end)
+
+    def put_start_and_end_on(self, start, end):
+        start = np.array(start, dtype=float)
+        end = np.array(end, dtype=float)
+        members = self.family_members_with_points()
+        if self._pose is not None:
+            last_start, last_end, first_point = self._pose
+            # The points may have been animated since, so check them as well
+            if np.array_equal(start, last_start) and np.array_equal(end, last_end) and np.array_equal(members[0].points[0], first_point):
+                return self
+
+        vect = end - start
+        length = np.linalg.norm(vect)
+        points = self._rest * (1, 1, length)
+        if length > 0:
+            points = points @ to_matrix(align_vectors(OUT, vect)).T
+        points += (start + end) / 2
+
+        offset = 0
+        for mob, size in zip(members, self._sizes):
+            mob.points = points[offset:offset + size]
+            offset += size
+
+        self.start, self.end = start, end
+        self.vect, self.length = vect, length
+        if length > 0:
+            self.direction = vect / length
+        self._pose = (start, end, members[0].points[0].copy())
+        return self
+
+
+# Parameters of the two handles and anchors of a straight cubic segment
+_LINE_T = np.linspace(0, 1, 4)[:, None]
+
+
+def _fill_lines(starts, ends, out):
+    # Straight cubic segments from each start to the matching end, written into out
+    np.multiply(_LINE_T, ends[:, None] - starts[:, None], out=out)
+    out += starts[:, None]
+
+
+class VertexMesh(VGroup):
+    """
+    Edges and faces drawn from one shared vertex array.
+    edge_indices has shape (E, 2) and face_indices (F, k); set_vertices() computes the
+    straight-segment bezier points of every edge and closed face from the (N, 3) vertex
+    array by indexing, then hands each submobject its slice. Submobjects whose updating
+    is suspended (i.e. being animated) keep the points the animation gives them.
+    """
+
+    def __init__(self, vertices, edge_indices=(), face_indices=(), edge_config=None, face_colors=None, face_config=None, **kwargs):
+        super().__init__(**kwargs)
+        self.edge_indices = np.asarray(edge_indices, dtype=int).reshape(-1, 2)
+        self.face_indices = np.asarray(face_indices, dtype=int)
+        if self.face_indices.ndim != 2:
+            self.face_indices = self.face_indices.reshape(0, 3)
+
+        self.edges = VGroup(*(VMobject(**(edge_config or {})) for _ in self.edge_indices))
+        face_colors = face_colors or [WHITE] * len(self.face_indices)
+        self.faces = VGroup(*(
+            VMobject(color=color, fill_color=color, **(face_config or {}))
+            for color in face_colors
+        ))
+        self.add(self.edges, self.faces)
+
+        self.vertices = None
+        self.set_vertices(vertices)
+
+    def set_vertices(self, vertices):
+        vertices = np.asarray(vertices, dtype=float)
+        self.vertices = vertices
+        return self.set_mesh_points(*self.mesh_points(vertices))
+
+    def mesh_points(self, vertices):
+        """
+        Bezier points of every edge and face for vertex arrays of shape (..., N, 3), so
+        all frames of a baked play can be computed at once.
+        Returns: (edge_points, face_points) of shapes (..., E, 4, 3) and (..., F, 4k, 3)
+        """
+        vertices = np.asarray(vertices, dtype=float)
+        starts = vertices[..., self.edge_indices[:, 0], :]
+        ends = vertices[..., self.edge_indices[:, 1], :]
+        edge_points = starts[..., None, :] + _LINE_T * (ends - starts)[..., None, :]
+
+        corners = vertices[..., self.face_indices, :]
+        closed = np.concatenate([corners, corners[..., :1, :]], axis=-2)
+        starts, ends = closed[..., :-1, :], closed[..., 1:, :]
+        face_points = starts[..., None, :] + _LINE_T * (ends - starts)[..., None, :]
+        face_points = face_points.reshape(*vertices.shape[:-2], len(self.face_indices), 4 * self.face_indices.shape[1], 3)
+        return edge_points, face_points
+
+    def set_mesh_points(self, edge_points, face_points):
+        for mobs, points in ((self.edges, edge_points), (self.faces, face_points)):
+            for mob, mob_points in zip(mobs.submobjects, points):
+                if not mob.updating_suspended:
+                    mob.points = mob_points
+        return self
+
+
+class RingTracedPath(VMobject):
+    """
+    TracedPath over a preallocated ring buffer of at most max_points anchors.
+    Points are simplified as they stream in: while a new point stays within tolerance
+    of the line leaving the previous anchor (in the direction the last anchor was first
+    appended with) and keeps moving forward along it, it replaces the last anchor
+    instead of being appended, so turning points are never merged away. Once the
+    buffer is full the oldest anchor is dropped, so memory and per-frame cost stay
+    bounded however long the trail runs.
+    """
+
+    def __init__(self, traced_point_func, stroke_width=2, stroke_color=WHITE, max_points=4096, tolerance=1e-3, **kwargs):
+        super().__init__(stroke_width=stroke_width, stroke_color=stroke_color, **kwargs)
+        if max_points < 2:
+            raise ValueError("max_points must be at least 2")
+        self.traced_point_func = traced_point_func
+        self.max_points = max_points
+        self.tolerance = tolerance
+        self._anchors = np.empty((max_points, 3))
+        self._bezier = np.empty((max_points - 1, 4, 3))
+        self._start = 0
+        self._count = 0
+        self._direction = None
+        self.add_updater(lambda m: m.update_path())
+
+    def _anchor(self, i):
+        return self._anchors[(self._start + i) % self.max_points]
+
+    def _append(self, point):
+        if self._count:
+            step = point - self._anchor(self._count - 1)
+            length = np.linalg.norm(step)
+            self._direction = step / length if length > 0 else None
+        if self._count == self.max_points:
+            self._anchors[self._start] = point
+            self._start = (self._start + 1) % self.max_points
+        else:
+            self._anchors[(self._start + self._count) % self.max_points] = point
+            self._count += 1
+
+    def update_path(self):
+        point = np.asarray(self.traced_point_func(), dtype=float)
+        if self._count >= 2 and self._direction is not None:
+            last = self._anchor(self._count - 1)
+            offset = point - self._anchor(self._count - 2)
+            deviation = np.linalg.norm(np.cross(self._direction, offset))
+            if deviation <= self.tolerance and np.dot(self._direction, point - last) >= 0:
+                self._anchors[(self._start + self._count - 1) % self.max_points] = point
+                self._set_bezier()
+                return self
+        self._append(point)
+        self._set_bezier()
+        return self
+
+    def _set_bezier(self):
+        n = self._count
+        if n < 2:
+            self.points = np.zeros((0, 3))
+            return
+        anchors = self._anchors
+        bezier = self._bezier[:n - 1]
+        start = self._start
+        # Anchors before the end of the buffer, then the ones that wrapped to its front
+        head = min(n, self.max_points - start)
+        _fill_lines(anchors[start:start + head - 1], anchors[start + 1:start + head], bezier[:head - 1])
+        if head < n:
+            _fill_lines(anchors[-1:], anchors[:1], bezier[head - 1:head])
+            _fill_lines(anchors[:n - head - 1], anchors[1:n - head], bezier[head:])
+        self.points = bezier.reshape(-1, 3)
+
+    def clear_trail(self):
+        self._start = 0
+        self._count = 0
+        self._direction = None
+        self.points = np.zeros((0, 3))
+        return self
+
+
+class MultiTracedPath(VGroup):
+    """
+    Trails of K points kept in one (K, max_points, 3) ring buffer.
+    positions() returns the (K, 3) traced points; every trail of the same colour is drawn
+    by one VMobject holding all of them as separate subpaths, so hundreds of trails cost
+    a handful of submobjects. A sample is merged into the last one while every trail is
+    within tolerance of its line leaving the previous anchor and moving forward along
+    it, as in RingTracedPath; a trail that was standing still must still be within
+    tolerance of its last anchor.
+    """
+
+    def __init__(self, positions, colors, stroke_width=2, max_points=4096, tolerance=1e-3, **kwargs):
+        super().__init__(**kwargs)
+        if max_points < 2:
+            raise ValueError("max_points must be at least 2")
+        self.positions = positions
+        self.max_points = max_points
+        self.tolerance = tolerance
+
+        first = np.asarray(positions(), dtype=float)
+        k = len(first)
+        colors = [colors] * k if isinstance(colors, str) else list(colors)
+        if len(colors) != k:
+            raise ValueError(f"got {len(colors)} colors for {k} trails")
+
+        self._groups = []
+        for color in dict.fromkeys(colors):
+            indices = np.array([i for i, c in enumerate(colors) if c == color])
+            mob = VMobject(stroke_color=color, stroke_width=stroke_width)
+            self._groups.append((indices, mob))
+            self.add(mob)
+
+        self._anchors = np.empty((k, max_points, 3))
+        self._start = 0
+        self._count = 0
+        self._direction = None
+        self.add_updater(lambda m: m.update_path())
+
+    def _slot(self, i):
+        return (self._start + i) % self.max_points
+
+    def _append(self, points):
+        if self._count:
+            step = points - self._anchors[:, self._slot(self._count - 1)]
+            lengths = np.linalg.norm(step, axis=1, keepdims=True)
+            self._direction = np.divide(step, lengths, out=np.zeros_like(step), where=lengths > 0)
+        if self._count == self.max_points:
+            self._anchors[:, self._start] = points
+            self._start = self._slot(1)
+        else:
+            self._anchors[:, self._slot(self._count)] = points
+            self._count += 1
+
+    def update_path(self):
+        points = np.asarray(self.positions(), dtype=float)
+        if self._count >= 2:
+            advances = points - self._anchors[:, self._slot(self._count - 1)]
+            offsets = points - self._anchors[:, self._slot(self._count - 2)]
+            stalled = ~self._direction.any(axis=1)
+            deviations = np.where(stalled, np.linalg.norm(advances, axis=1), np.linalg.norm(np.cross(self._direction, offsets), axis=1))
+            forward = np.einsum("ij,ij->i", self._direction, advances) >= 0
+            if deviations.max() <= self.tolerance and forward.all():
+                self._anchors[:, self._slot(self._count - 1)] = points
+                self._set_bezier()
+                return self
+        self._append(points)
+        self._set_bezier()
+        return self
+
+    def _set_bezier(self):
+        n = self._count
+        for indices, mob in self._groups:
+            if n < 2:
+                mob.points = np.zeros((0, 3))
+                continue
+            end = self._start + n
+            if end <= self.max_points:
+                anchors = self._anchors[indices, self._start:end]
+            else:
+                anchors = np.concatenate([self._anchors[indices, self._start:], self._anchors[indices, :end - self.max_points]], axis=1)
+            starts = anchors[:, :-1, None]
+            bezier = starts + _LINE_T * (anchors[:, 1:, None] - starts)
+            mob.points = bezier.reshape(-1, 3)
+
+    def clear_trail(self):
+        self._start = 0
+        self._count = 0
+        self._direction = None
+        self._set_bezier()
+        return self
@@ -0,0 +1,389 @@
+import hashlib
+import inspect
+import json
+import os
+import shutil
+import types
+from contextlib import contextmanager
+
+import numpy as np
+from manim import Mobject, Scene, ValueTracker, config, logger, tempconfig
+
+from reactive import Computed
+
+
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+CACHE_DIR = os.path.join(ROOT, ".cache", "plays")
+MAX_DEPTH = 8
+
+
+def _is_project(obj):
+    """
+    True for functions and classes defined in this repository's own modules.
+    """
+    try:
+        path = inspect.getsourcefile(obj)
+    except TypeError:
+        return False
+    return path is not None and os.path.dirname(os.path.abspath(path)) == ROOT
+
+
+def _source(obj):
+    try:
+        return inspect.getsource(obj)
+    except (OSError, TypeError):
+        code = getattr(obj, "__code__", None)
+        return code.co_code.hex() if code is not None else type(obj).__qualname__
+
+
+def _global_names(code):
+    """
+    Names a code object and the lambdas and functions nested in it may look up as globals.
+    """
+    names = set(code.co_names)
+    for const in code.co_consts:
+        if isinstance(const, types.CodeType):
+            names |= _global_names(const)
+    return names
+
+
+class _Hasher:
+    """
+    Feeds a structural description of Python values into sha256.
+    Functions contribute their source, defaults and closure cells; project functions
+    also the globals they or their nested lambdas read, i.e. other project functions and
+    the values of module constants. Objects of project classes contribute their class
+    source and attributes; mobjects the points and colours of their whole family, so a
+    Dot3D or an Axes group reached from a closure is covered by its faces and ticks.
+    ValueTracker values are collected in trackers rather than hashed, so a changed
+    tracker is reported on its own.
+    """
+
+    def __init__(self, trackers):
+        self.sha = hashlib.sha256()
+        self.trackers = trackers
+        self._seen = set()
+
+    def update(self, value, depth=0):
+        sha = self.sha
+        if value is None or isinstance(value, (bool, int, float, complex, str, bytes)):
+            sha.update(repr(value).encode())
+            return
+        if isinstance(value, np.generic):
+            sha.update(repr(value.item()).encode())
+            return
+        if isinstance(value, np.ndarray):
+            sha.update(f"{value.dtype.str}{value.shape}".encode())
+            sha.update(np.ascontiguousarray(value).tobytes())
+            return
+        if depth > MAX_DEPTH or id(value) in self._seen:
+            sha.update(type(value).__qualname__.encode())
+            return
+        self._seen.add(id(value))
+
+        if isinstance(value, (list, tuple, set, frozenset)):
+            sha.update(f"{type(value).__name__}{len(value)}".encode())
+            items = sorted(value, key=repr) if isinstance(value, (set, frozenset)) else value
+            for item in items:
+                self.update(item, depth + 1)
+        elif isinstance(value, dict):
+            sha.update(f"dict{len(value)}".encode())
+            for key, item in value.items():
+                self.update(key, depth + 1)
+                self.update(item, depth + 1)
+        elif isinstance(value, ValueTracker):
+            self.trackers.append(float(value.get_value()))
+            sha.update(b"ValueTracker")
+        elif isinstance(value, Computed):
+            self.update(value.func, depth + 1)
+            self.update(value.inputs, depth + 1)
+        elif isinstance(value, types.MethodType):
+            self.update(value.__func__, depth + 1)
+            self.update(type(value.__self__).__qualname__)
+        elif isinstance(value, types.FunctionType):
+            self._update_function(value, depth)
+        elif hasattr(value, "to_hex"):
+            # Colours
+            sha.update(value.to_hex().encode())
+        elif isinstance(value, Mobject):
+            for member in value.get_family():
+                self.update_mobject(member, depth)
+        elif isinstance(value, Scene) or not _is_project(type(value)):
+            # Scenes, renderers and library objects are identified by type only
+            sha.update(type(value).__qualname__.encode())
+        else:
+            self._update_class(type(value))
+            self.update(vars(value), depth + 1)
+
+    def _update_function(self, func, depth):
+        self.sha.update(_source(func).encode())
+        self.update(func.__defaults__, depth + 1)
+        self.update(func.__kwdefaults__, depth + 1)
+        for cell in func.__closure__ or ():
+            try:
+                contents = cell.cell_contents
+            except ValueError:
+                contents = None
+            self.update(contents, depth + 1)
+        if not _is_project(func):
+            return
+        for name in sorted(_global_names(func.__code__)):
+            if name not in func.__globals__:
+                continue
+            target = func.__globals__[name]
+            if isinstance(target, types.ModuleType):
+                continue
+            self.update(name)
+            if isinstance(target, type):
+                if _is_project(target):
+                    self._update_class(target)
+                else:
+                    self.update(f"{target.__module__}.{target.__qualname__}")
+            elif isinstance(target, types.FunctionType) and not _is_project(target):
+                self.update(f"{target.__module__}.{target.__qualname__}")
+            else:
+                # Project functions, and the values of constants such as speeds or axes
+                self.update(target, depth + 1)
+
+    def _update_class(self, cls):
+        for base in cls.__mro__:
+            if _is_project(base) and id(base) not in self._seen:
+                self._seen.add(id(base))
+                self.sha.update(_source(base).encode())
+
+    def update_mobject(self, mobject, depth=0):
+        sha = self.sha
+        sha.update(type(mobject).__qualname__.encode())
+        self._update_class(type(mobject))
+        self.update(mobject.points)
+        for name in (
+            "fill_rgbas", "stroke_rgbas", "background_stroke_rgbas", "stroke_width",
+            "z_index", "shade_in_3d", "sheen_factor", "sheen_direction",
+        ):
+            if hasattr(mobject, name):
+                self.update(getattr(mobject, name))
+        if _is_project(type(mobject)):
+            # e.g. the positions function of a VertexDots group
+            ignored = {"points", "submobjects", "updaters", "fill_rgbas", "stroke_rgbas", "background_stroke_rgbas"}
+            for name, attribute in vars(mobject).items():
+                if name not in ignored and (callable(attribute) or isinstance(attribute, (dict, list, tuple, Computed))):
+                    self.update(name)
+                    self.update(attribute, depth + 1)
+
+    def hexdigest(self):
+        return self.sha.hexdigest()
+
+
+def digest(*values):
+    """
+    sha256 of values as the play cache sees them, tracker values included.
+    Returns: hex digest
+    """
+    trackers = []
+    hasher = _Hasher(trackers)
+    hasher.update(values)
+    hasher.update(trackers)
+    return hasher.hexdigest()
+
+
+def _family(scene):
+    seen = {}
+    for mobject in scene.mobjects:
+        for member in mobject.get_family():
+            seen.setdefault(id(member), member)
+    return list(seen.values())
+
+
+def _digest(feed):
+    trackers = []
+    hasher = _Hasher(trackers)
+    feed(hasher)
+    return hasher.hexdigest(), trackers
+
+
+def play_components(scene, animations, kwargs):
+    """
+    Everything a play's frames depend on, one digest per component, so a cache miss
+    can say what changed.
+    Returns: dict component name -> sha256 hex digest
+    """
+    family = _family(scene)
+    trackers = []
+
+    def snapshot(hasher):
+        for mobject in family:
+            hasher.update_mobject(mobject)
+
+    def updaters(hasher):
+        for mobject in family:
+            hasher.update(mobject.updaters)
+
+    def animations_feed(hasher):
+        for animation in animations:
+            hasher.update(type(animation).__qualname__)
+            hasher.update({name: value for name, value in vars(animation).items() if not name.startswith("_")})
+        hasher.update(kwargs)
+
+    def camera(hasher):
+        camera = scene.renderer.camera
+        if hasattr(camera, "get_value_trackers"):
+            hasher.update([tracker.get_value() for tracker in camera.get_value_trackers()])
+        for name, value in sorted(vars(camera).items()):
+            if isinstance(value, (int, float, str)) or (isinstance(value, np.ndarray) and value.size <= 16):
+                hasher.update(name)
+                hasher.update(value)
+        if hasattr(camera, "frame"):
+            hasher.update_mobject(camera.frame)
+        # Mobjects pinned to the frame by a ThreeDCamera, identified by their place in
+        # the scene so the digest is the same from one run to the next
+        positions = {id(mobject): i for i, mobject in enumerate(family)}
+        if hasattr(camera, "fixed_in_frame_mobjects"):
+            hasher.update("fixed_in_frame")
+            hasher.update(sorted(positions.get(id(mobject), -1) for mobject in camera.fixed_in_frame_mobjects))
+        if hasattr(camera, "fixed_orientation_mobjects"):
+            hasher.update("fixed_orientation")
+            for mobject, center_func in sorted(camera.fixed_orientation_mobjects.items(), key=lambda item: positions.get(id(item[0]), -1)):
+                hasher.update(positions.get(id(mobject), -1))
+                hasher.update(center_func)
+
+    components = {}
+    for name, feed in (("snapshot", snapshot), ("updaters", updaters), ("animations", animations_feed), ("camera", camera)):
+        digest, found = _digest(feed)
+        components[name] = digest
+        trackers += found
+    components["trackers"] = _digest(lambda hasher: hasher.update(trackers))[0]
+    components["config"] = _digest(lambda hasher: hasher.update([
+        config.pixel_width, config.pixel_height, config.frame_rate, config.frame_width,
+        config.frame_height, str(config.background_color), config.movie_file_extension,
+    ]))[0]
+    return components
+
+
+def _will_skip(renderer):
+    if renderer._original_skipping_status or not config.write_to_movie:
+        return True
+    if config.from_animation_number and renderer.num_plays < config.from_animation_number:
+        return True
+    upto = config.upto_animation_number
+    return bool(upto) and upto > 0 and renderer.num_plays > upto
+
+
+def finish_skipped_plays(scene):
+    """
+    Make skipped plays run their updaters only and end with the update_mobjects(0) that
+    manim only runs after a rendered play, so skipping a play leaves the scene as
+    rendering it would. Skipped plays stepped frame by frame would otherwise still have
+    every frame drawn by the renderer, only for the frame to be thrown away.
+    Installing it more than once has no further effect.
+    """
+    if getattr(scene, "finishes_skipped_plays", False):
+        return
+    play_internal = scene.play_internal
+
+    def finished_play_internal(skip_rendering=False):
+        skipped = scene.renderer.skip_animations
+        play_internal(skip_rendering=skip_rendering or skipped)
+        if skipped:
+            scene.update_mobjects(0)
+
+    scene.play_internal = finished_play_internal
+    scene.finishes_skipped_plays = True
+
+
+@contextmanager
+def _skipping_frame_by_frame(scene):
+    # The play is skipped, so nothing is drawn or encoded, but its updaters still step
+    # through every frame and leave the scene exactly as a rendered play would
+    finish_skipped_plays(scene)
+    renderer = scene.renderer
+    original_status = renderer._original_skipping_status
+    had_override = "get_time_progression" in vars(scene)
+    get_time_progression = scene.get_time_progression
+
+    def frame_accurate(run_time, *args, **kwargs):
+        kwargs["override_skip_animations"] = True
+        return get_time_progression(run_time, *args, **kwargs)
+
+    renderer._original_skipping_status = True
+    scene.get_time_progression = frame_accurate
+    try:
+        yield
+    finally:
+        renderer._original_skipping_status = original_status
+        if had_override:
+            scene.get_time_progression = get_time_progression
+        else:
+            del scene.get_time_progression
+
+
+def _substitute_last_partial(file_writer, path):
+    file_writer.partial_movie_files[-1] = path
+    sections = getattr(file_writer, "sections", None)
+    if sections and sections[-1].partial_movie_files:
+        sections[-1].partial_movie_files[-1] = path
+
+
+def _manifest_path(cache_dir, slot):
+    return os.path.join(cache_dir, "manifest", f"{slot}.json")
+
+
+def _report_miss(cache_dir, slot, components):
+    path = _manifest_path(cache_dir, slot)
+    if not os.path.exists(path):
+        logger.info(f"{slot}: not cached yet")
+        return
+    with open(path) as f:
+        previous = json.load(f)["components"]
+    changed = [name for name, digest in components.items() if previous.get(name) != digest]
+    logger.info(f"{slot}: cache invalidated by changes to {', '.join(changed)}")
+
+
+def _write_manifest(cache_dir, slot, key, components):
+    path = _manifest_path(cache_dir, slot)
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    tmp_path = path + ".tmp"
+    with open(tmp_path, "w") as f:
+        json.dump({"key": key, "components": components}, f, indent=1)
+    os.replace(tmp_path, path)
+
+
+def cached_play(scene, *animations, cache_dir=CACHE_DIR, **kwargs):
+    """
+    scene.play() for tracker- and updater-driven animations, which manim's own hash
+    cannot see into. The key covers the updater closures (source and captured values),
+    tracker values, the animations with their rate function and run time, the scene's
+    mobjects, the camera and the output config.
+    On a hit the play is skipped frame by frame and the cached partial movie is used;
+    on a miss it renders uncached, the partial movie is copied into the cache and the
+    log names the components that changed since the slot was last rendered.
+    """
+    renderer = scene.renderer
+    if _will_skip(renderer):
+        with tempconfig({"disable_caching": True}):
+            scene.play(*animations, **kwargs)
+        return
+
+    slot = f"{type(scene).__name__}_{renderer.num_plays:05}"
+    components = play_components(scene, animations, kwargs)
+    key = hashlib.sha256(json.dumps(components, sort_keys=True).encode()).hexdigest()[:32]
+    cached_path = os.path.join(cache_dir, f"{key}{config.movie_file_extension}")
+
+    file_writer = renderer.file_writer
+    if os.path.exists(cached_path):
+        logger.info(f"{slot}: using cached play {key}")
+        with tempconfig({"disable_caching": True}), _skipping_frame_by_frame(scene):
+            scene.play(*animations, **kwargs)
+        _substitute_last_partial(file_writer, cached_path)
+        return
+
+    _report_miss(cache_dir, slot, components)
+    count = len(file_writer.partial_movie_files)
+    with tempconfig({"disable_caching": True}):
+        scene.play(*animations, **kwargs)
+    if len(file_writer.partial_movie_files) > count and file_writer.partial_movie_files[-1] is not None:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = cached_path + ".tmp"
+        shutil.copyfile(file_writer.partial_movie_files[-1], tmp_path)
+        os.replace(tmp_path, cached_path)
+        _write_manifest(cache_dir, slot, key, components)
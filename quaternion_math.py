@@ -0,0 +1,783 @@
+import math
+import numbers
+import os
+from collections import OrderedDict, namedtuple
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from euler_kernels import KERNELS as EULER_KERNELS
+
+
+
+def _as_quaternions(q):
+    q = np.asarray(q, dtype=float)
+    if q.shape[-1:] != (4,):
+        raise ValueError(f"expected quaternions with a trailing axis of length 4, got shape {q.shape}")
+    return q
+
+
+def quaternion_multiply(q1, q2, out=None):
+    """
+    Hamilton product of two quaternion arrays.
+    q1 and q2 are array-likes of shape (..., 4): (w, x, y, z), broadcast against each other.
+    out is an optional buffer of the broadcast shape; it may alias q1 or q2.
+    Returns: array of shape (..., 4)
+    """
+    q1 = _as_quaternions(q1)
+    q2 = _as_quaternions(q2)
+    shape = np.broadcast_shapes(q1.shape, q2.shape)
+
+    if out is None:
+        out = np.empty(shape)
+    elif out.shape != shape:
+        raise ValueError(f"out has shape {out.shape}, expected {shape}")
+
+    w1, x1, y1, z1 = q1[..., 0], q1[..., 1], q1[..., 2], q1[..., 3]
+    w2, x2, y2, z2 = q2[..., 0], q2[..., 1], q2[..., 2], q2[..., 3]
+
+    # All four components are computed before anything is written,
+    # so out can safely be one of the inputs
+    w = w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2
+    x = w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2
+    y = w1 * y2 - x1 * z2 + y1 * w2 + z1 * x2
+    z = w1 * z2 + x1 * y2 - y1 * x2 + z1 * w2
+
+    out[..., 0] = w
+    out[..., 1] = x
+    out[..., 2] = y
+    out[..., 3] = z
+    return out
+
+
+def quaternion_conjugate(q, out=None):
+    """
+    Conjugate of a quaternion array: (w, -x, -y, -z)
+    Returns: array of shape (..., 4)
+    """
+    q = _as_quaternions(q)
+    if out is None:
+        out = np.empty(q.shape)
+    out[..., 0] = q[..., 0]
+    np.negative(q[..., 1:], out=out[..., 1:])
+    return out
+
+
+def to_matrix(q):
+    """
+    Rotation matrices of unit quaternions.
+    q has shape (..., 4): (w, x, y, z)
+    Returns: array of shape (..., 3, 3)
+    """
+    q = _as_quaternions(q)
+    w, x, y, z = q[..., 0], q[..., 1], q[..., 2], q[..., 3]
+
+    xx, yy, zz = x * x, y * y, z * z
+    xy, xz, yz = x * y, x * z, y * z
+    wx, wy, wz = w * x, w * y, w * z
+
+    R = np.empty(q.shape[:-1] + (3, 3))
+    R[..., 0, 0] = 1 - 2 * (yy + zz)
+    R[..., 0, 1] = 2 * (xy - wz)
+    R[..., 0, 2] = 2 * (xz + wy)
+    R[..., 1, 0] = 2 * (xy + wz)
+    R[..., 1, 1] = 1 - 2 * (xx + zz)
+    R[..., 1, 2] = 2 * (yz - wx)
+    R[..., 2, 0] = 2 * (xz - wy)
+    R[..., 2, 1] = 2 * (yz + wx)
+    R[..., 2, 2] = 1 - 2 * (xx + yy)
+    return R
+
+
+def from_matrix(R):
+    """
+    Unit quaternions of rotation matrices, using Shepperd's method.
+    R has shape (..., 3, 3)
+    Returns: array of shape (..., 4) with w >= 0
+    """
+    R = np.asarray(R, dtype=float)
+    if R.shape[-2:] != (3, 3):
+        raise ValueError(f"expected matrices with trailing shape (3, 3), got shape {R.shape}")
+
+    r00, r01, r02 = R[..., 0, 0], R[..., 0, 1], R[..., 0, 2]
+    r10, r11, r12 = R[..., 1, 0], R[..., 1, 1], R[..., 1, 2]
+    r20, r21, r22 = R[..., 2, 0], R[..., 2, 1], R[..., 2, 2]
+
+    # 4w^2, 4x^2, 4y^2, 4z^2 - the largest one gives the best conditioned formula
+    t = np.stack([
+        1 + r00 + r11 + r22,
+        1 + r00 - r11 - r22,
+        1 - r00 + r11 - r22,
+        1 - r00 - r11 + r22,
+    ], axis=-1)
+
+    candidates = np.stack([
+        np.stack([t[..., 0], r21 - r12, r02 - r20, r10 - r01], axis=-1),
+        np.stack([r21 - r12, t[..., 1], r01 + r10, r02 + r20], axis=-1),
+        np.stack([r02 - r20, r01 + r10, t[..., 2], r12 + r21], axis=-1),
+        np.stack([r10 - r01, r02 + r20, r12 + r21, t[..., 3]], axis=-1),
+    ], axis=-2)
+
+    k = np.argmax(t, axis=-1)[..., None]
+    q = np.take_along_axis(candidates, k[..., None], axis=-2)[..., 0, :]
+    q *= (0.5 / np.sqrt(np.take_along_axis(t, k, axis=-1)))
+    q *= np.where(q[..., :1] < 0, -1.0, 1.0)
+    return q
+
+
+CacheInfo = namedtuple("CacheInfo", ["hits", "misses", "maxsize", "currsize"])
+
+
+class _MatrixCache:
+    """
+    Bounded LRU cache of rotation matrices keyed on the exact quaternion value.
+    """
+
+    def __init__(self, maxsize=128):
+        self.maxsize = maxsize
+        self.hits = 0
+        self.misses = 0
+        self._matrices = OrderedDict()
+
+    def get(self, q):
+        key = q.tobytes()
+        R = self._matrices.get(key)
+        if R is not None:
+            self.hits += 1
+            self._matrices.move_to_end(key)
+            return R
+
+        self.misses += 1
+        R = to_matrix(q)
+        R.setflags(write=False)
+        self._matrices[key] = R
+        if len(self._matrices) > self.maxsize:
+            self._matrices.popitem(last=False)
+        return R
+
+    def info(self):
+        return CacheInfo(self.hits, self.misses, self.maxsize, len(self._matrices))
+
+    def clear(self):
+        self._matrices.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+_matrix_cache = _MatrixCache()
+
+
+def cached_matrix(q):
+    """
+    Rotation matrix of a single unit quaternion, served from the shared cache.
+    Returns: read-only array of shape (3, 3)
+    """
+    q = _as_quaternions(q)
+    if q.ndim != 1:
+        raise ValueError(f"expected a single quaternion, got shape {q.shape}")
+    return _matrix_cache.get(q)
+
+
+def matrix_cache_info():
+    """
+    Returns: CacheInfo(hits, misses, maxsize, currsize) of the rotation matrix cache
+    """
+    return _matrix_cache.info()
+
+
+def matrix_cache_clear():
+    _matrix_cache.clear()
+
+
+# Above this many points a single quaternion is turned into a 3x3 matrix first
+MATRIX_MIN_POINTS = 64
+
+
+def rotate_points(q, points, out=None):
+    """
+    Rotate points by unit quaternions: the vector part of q * (0, p) * q'.
+    q has shape (4,) or (..., 4) and broadcasts against points of shape (..., 3).
+    Uses p + w t + u x t with t = 2 u x p, so no pure quaternion is ever built.
+    A single q rotating many points goes through the cached rotation matrix instead.
+    Returns: array of shape (..., 3)
+    """
+    q = _as_quaternions(q)
+    points = np.asarray(points, dtype=float)
+    if points.shape[-1:] != (3,):
+        raise ValueError(f"expected points with a trailing axis of length 3, got shape {points.shape}")
+
+    if q.ndim == 1 and points.ndim == 2 and len(points) >= MATRIX_MIN_POINTS:
+        return np.matmul(points, _matrix_cache.get(q).T, out=out)
+
+    shape = np.broadcast_shapes(q.shape[:-1] + (3,), points.shape)
+    if out is None:
+        out = np.empty(shape)
+    elif out.shape != shape:
+        raise ValueError(f"out has shape {out.shape}, expected {shape}")
+
+    w, ux, uy, uz = q[..., 0], q[..., 1], q[..., 2], q[..., 3]
+    px, py, pz = points[..., 0], points[..., 1], points[..., 2]
+
+    tx = 2 * (uy * pz - uz * py)
+    ty = 2 * (uz * px - ux * pz)
+    tz = 2 * (ux * py - uy * px)
+
+    x = px + w * tx + (uy * tz - uz * ty)
+    y = py + w * ty + (uz * tx - ux * tz)
+    z = pz + w * tz + (ux * ty - uy * tx)
+
+    out[..., 0] = x
+    out[..., 1] = y
+    out[..., 2] = z
+    return out
+
+
+def align_vectors(a, b):
+    """
+    Shortest-arc rotation taking the direction of a onto the direction of b.
+    Opposite vectors get a half turn about an axis perpendicular to a.
+    Returns: unit quaternion of shape (4,)
+    """
+    a = np.asarray(a, dtype=float)
+    b = np.asarray(b, dtype=float)
+    a = a / np.linalg.norm(a)
+    b = b / np.linalg.norm(b)
+    dot = np.dot(a, b)
+    if dot < -1 + 1e-12:
+        axis = np.cross(a, [1.0, 0.0, 0.0])
+        if np.linalg.norm(axis) < 1e-6:
+            axis = np.cross(a, [0.0, 1.0, 0.0])
+        return np.concatenate([[0.0], axis / np.linalg.norm(axis)])
+    q = np.concatenate([[1 + dot], np.cross(a, b)])
+    return q / np.linalg.norm(q)
+
+
+# Keyframes closer than this (in |q0 . q1|) are blended with normalized lerp
+SLERP_DOT_THRESHOLD = 1 - 1e-8
+
+
+def slerp(q0, q1, t):
+    """
+    Spherical linear interpolation between unit quaternions along the shorter arc.
+    q0 and q1 have shape (..., 4); t broadcasts against their leading shape,
+    e.g. q0[:, None], q1[:, None] with t of shape (T,) resamples every pair at T times.
+    The angle and sin(angle) are computed once per pair, not once per t.
+    Returns: array of shape (..., 4)
+    """
+    q0 = _as_quaternions(q0)
+    q1 = _as_quaternions(q1)
+    t = np.asarray(t, dtype=float)
+
+    dot = np.sum(q0 * q1, axis=-1)
+    # q and -q are the same rotation; flip q1 so the path takes the shorter arc
+    q1 = q1 * np.where(dot < 0, -1.0, 1.0)[..., None]
+    dot = np.abs(dot)
+
+    theta = np.arccos(np.minimum(dot, 1.0))
+    small = dot > SLERP_DOT_THRESHOLD
+    sin_theta = np.where(small, 1.0, np.sin(theta))
+
+    s0 = np.where(small, 1 - t, np.sin((1 - t) * theta) / sin_theta)
+    s1 = np.where(small, t, np.sin(t * theta) / sin_theta)
+
+    q = s0[..., None] * q0 + s1[..., None] * q1
+    norm = np.where(small, np.linalg.norm(q, axis=-1), 1.0)
+    q /= norm[..., None]
+    return q
+
+
+EULER_ORDERS = tuple(EULER_KERNELS)
+
+
+def from_euler(angles, order="XYZ", out=None):
+    """
+    Quaternions from Euler angles in any of the 12 orders of the equation generator.
+    angles has shape (..., 3), angles[..., i] is the rotation about axis order[i],
+    so q = q_3 q_2 q_1 (the first axis is applied first).
+    Returns: array of shape (..., 4)
+    """
+    try:
+        kernel = EULER_KERNELS[order.upper()]
+    except KeyError:
+        raise ValueError(f"unknown Euler order {order!r}, expected one of {', '.join(EULER_ORDERS)}") from None
+    return kernel(angles, out=out)
+
+
+# Middle angles this close to their singular value are treated as gimbal lock
+GIMBAL_LOCK_TOLERANCE = 1e-7
+
+
+def to_euler(q, order="XYZ", out=None, return_gimbal_lock=False):
+    """
+    Euler angles of unit quaternions, the inverse of from_euler for all 12 orders.
+    q has shape (..., 4); angles[..., i] is the rotation about axis order[i], wrapped to [-pi, pi].
+    Gimbal lock is resolved per element with a mask: the third angle is set to 0
+    and the whole rotation is carried by the first one.
+    Returns: array of shape (..., 3), plus the boolean lock mask if return_gimbal_lock
+    """
+    q = _as_quaternions(q)
+    order = order.upper()
+    if order not in EULER_KERNELS:
+        raise ValueError(f"unknown Euler order {order!r}, expected one of {', '.join(EULER_ORDERS)}")
+
+    # Direct quaternion method of Bernardes & Viollet (2022), for rotations about fixed axes
+    i, j, k = ("XYZ".index(axis) + 1 for axis in order)
+    proper = i == k
+    if proper:
+        k = 6 - i - j
+    # +1 for an even permutation of the axes, -1 for an odd one
+    sign = (i - j) * (j - k) * (k - i) // 2
+
+    w = q[..., 0]
+    if proper:
+        a, b, c, d = w, q[..., i], q[..., j], q[..., k] * sign
+    else:
+        a = w - q[..., j]
+        b = q[..., i] + q[..., k] * sign
+        c = q[..., j] + w
+        d = q[..., k] * sign - q[..., i]
+
+    if out is None:
+        out = np.empty(q.shape[:-1] + (3,))
+
+    middle = 2 * np.arctan2(np.hypot(c, d), np.hypot(a, b))
+    at_zero = np.abs(middle) <= GIMBAL_LOCK_TOLERANCE
+    at_pi = np.abs(middle - np.pi) <= GIMBAL_LOCK_TOLERANCE
+    locked = at_zero | at_pi
+
+    half_sum = np.arctan2(b, a)
+    half_diff = np.arctan2(d, c)
+
+    first = np.where(locked, np.where(at_zero, 2 * half_sum, -2 * half_diff), half_sum - half_diff)
+    last = np.where(locked, 0.0, half_sum + half_diff)
+    if not proper:
+        last *= sign
+        middle -= np.pi / 2
+
+    out[..., 0] = first
+    out[..., 1] = middle
+    out[..., 2] = last
+    out += np.pi
+    np.mod(out, 2 * np.pi, out=out)
+    out -= np.pi
+
+    if return_gimbal_lock:
+        return out, locked
+    return out
+
+
+class Quaternion:
+    """
+    Immutable scalar quaternion (w, x, y, z) on plain floats.
+    Scalar operations never allocate a NumPy array; use the array functions for batches.
+    q1 * q2 is the Hamilton product, ~q the conjugate and abs(q) the norm.
+    """
+
+    __slots__ = ("w", "x", "y", "z")
+
+    def __init__(self, w=1.0, x=0.0, y=0.0, z=0.0):
+        object.__setattr__(self, "w", float(w))
+        object.__setattr__(self, "x", float(x))
+        object.__setattr__(self, "y", float(y))
+        object.__setattr__(self, "z", float(z))
+
+    def __setattr__(self, name, value):
+        raise AttributeError("Quaternion is immutable")
+
+    def __delattr__(self, name):
+        raise AttributeError("Quaternion is immutable")
+
+    @classmethod
+    def from_axis_angle(cls, axis, angle):
+        """
+        Unit quaternion rotating by angle (radians) about axis; the axis need not be normalized.
+        """
+        ax, ay, az = axis
+        norm = math.sqrt(ax * ax + ay * ay + az * az)
+        if norm == 0:
+            return cls()
+        s = math.sin(angle / 2) / norm
+        return cls(math.cos(angle / 2), ax * s, ay * s, az * s)
+
+    @property
+    def vector(self):
+        return (self.x, self.y, self.z)
+
+    def normalized(self):
+        norm = abs(self)
+        if norm == 0:
+            return self
+        return Quaternion(self.w / norm, self.x / norm, self.y / norm, self.z / norm)
+
+    def inverse(self):
+        n2 = self.w * self.w + self.x * self.x + self.y * self.y + self.z * self.z
+        return Quaternion(self.w / n2, -self.x / n2, -self.y / n2, -self.z / n2)
+
+    def rotate(self, v):
+        """
+        Rotate a 3D point by this unit quaternion: the vector part of q * (0, v) * q'.
+        Returns: (x, y, z)
+        """
+        w, ux, uy, uz = self.w, self.x, self.y, self.z
+        px, py, pz = v
+        tx = 2 * (uy * pz - uz * py)
+        ty = 2 * (uz * px - ux * pz)
+        tz = 2 * (ux * py - uy * px)
+        return (
+            px + w * tx + (uy * tz - uz * ty),
+            py + w * ty + (uz * tx - ux * tz),
+            pz + w * tz + (ux * ty - uy * tx),
+        )
+
+    def __mul__(self, other):
+        if isinstance(other, Quaternion):
+            w1, x1, y1, z1 = self.w, self.x, self.y, self.z
+            w2, x2, y2, z2 = other.w, other.x, other.y, other.z
+            return Quaternion(
+                w1 * w2 - x1 * x2 - y1 * y2 - z1 * z2,
+                w1 * x2 + x1 * w2 + y1 * z2 - z1 * y2,
+                w1 * y2 - x1 * z2 + y1 * w2 + z1 * x2,
+                w1 * z2 + x1 * y2 - y1 * x2 + z1 * w2,
+            )
+        if isinstance(other, numbers.Real):
+            return Quaternion(self.w * other, self.x * other, self.y * other, self.z * other)
+        return NotImplemented
+
+    def __rmul__(self, other):
+        if isinstance(other, numbers.Real):
+            return Quaternion(self.w * other, self.x * other, self.y * other, self.z * other)
+        return NotImplemented
+
+    def __truediv__(self, other):
+        if isinstance(other, numbers.Real):
+            return Quaternion(self.w / other, self.x / other, self.y / other, self.z / other)
+        return NotImplemented
+
+    def __add__(self, other):
+        if isinstance(other, Quaternion):
+            return Quaternion(self.w + other.w, self.x + other.x, self.y + other.y, self.z + other.z)
+        return NotImplemented
+
+    def __sub__(self, other):
+        if isinstance(other, Quaternion):
+            return Quaternion(self.w - other.w, self.x - other.x, self.y - other.y, self.z - other.z)
+        return NotImplemented
+
+    def __neg__(self):
+        return Quaternion(-self.w, -self.x, -self.y, -self.z)
+
+    def __invert__(self):
+        return Quaternion(self.w, -self.x, -self.y, -self.z)
+
+    def __abs__(self):
+        return math.sqrt(self.w * self.w + self.x * self.x + self.y * self.y + self.z * self.z)
+
+    def __iter__(self):
+        yield self.w
+        yield self.x
+        yield self.y
+        yield self.z
+
+    def __array__(self, dtype=None, copy=None):
+        return np.array((self.w, self.x, self.y, self.z), dtype=dtype)
+
+    def __eq__(self, other):
+        if isinstance(other, Quaternion):
+            return (self.w, self.x, self.y, self.z) == (other.w, other.x, other.y, other.z)
+        return NotImplemented
+
+    def __hash__(self):
+        return hash((self.w, self.x, self.y, self.z))
+
+    def __repr__(self):
+        return f"Quaternion({self.w!r}, {self.x!r}, {self.y!r}, {self.z!r})"
+
+
+# Rows per block for QuaternionArray operations that write into an existing
+# buffer, so temporaries stay small however large the array is
+BLOCK_ROWS = 1 << 16
+
+
+class QuaternionArray:
+    """
+    N quaternions in one (N, 4) float64 buffer.
+    .w and .xyz are views into the buffer, row slices (stepped ones included) are views,
+    so in-place operations on them reach the parent, and np.asarray(qa) returns the
+    buffer itself; fancy indexing copies, as it does in NumPy.
+    A float64 array passed in is wrapped as it is, strided or not.
+    """
+
+    __slots__ = ("data",)
+
+    def __init__(self, data, copy=False):
+        data = np.array(data, dtype=float, order="C", copy=True) if copy else np.asarray(data, dtype=float)
+        if data.ndim != 2 or data.shape[1] != 4:
+            raise ValueError(f"expected an (N, 4) array, got shape {data.shape}")
+        self.data = data
+
+    @classmethod
+    def identity(cls, n):
+        data = np.zeros((n, 4))
+        data[:, 0] = 1
+        return cls(data)
+
+    @classmethod
+    def from_axis_angle(cls, axes, angles):
+        axes = np.asarray(axes, dtype=float)
+        angles = np.asarray(angles, dtype=float)
+        norm = np.linalg.norm(axes, axis=-1)
+        scale = np.sin(angles / 2) / np.where(norm == 0, 1.0, norm)
+        data = np.empty(np.broadcast_shapes(axes.shape[:-1], angles.shape) + (4,))
+        data[..., 0] = np.cos(angles / 2)
+        data[..., 1:] = axes * scale[..., None]
+        return cls(data)
+
+    @classmethod
+    def from_euler(cls, angles, order="XYZ"):
+        return cls(from_euler(angles, order))
+
+    @property
+    def w(self):
+        return self.data[:, 0]
+
+    @property
+    def xyz(self):
+        return self.data[:, 1:]
+
+    @property
+    def shape(self):
+        return self.data.shape
+
+    def __len__(self):
+        return len(self.data)
+
+    def __array__(self, dtype=None, copy=None):
+        if copy:
+            return self.data.astype(dtype or float, copy=True)
+        if dtype is not None and np.dtype(dtype) != self.data.dtype:
+            return self.data.astype(dtype)
+        return self.data
+
+    def __getitem__(self, index):
+        if isinstance(index, tuple):
+            raise IndexError("QuaternionArray is indexed by row only; use .data for components")
+        rows = self.data[index]
+        if rows.ndim == 1:
+            return Quaternion(*rows)
+        return QuaternionArray(rows)
+
+    def __setitem__(self, index, value):
+        self.data[index] = np.asarray(value, dtype=float)
+
+    def __iter__(self):
+        for row in self.data:
+            yield Quaternion(*row)
+
+    def __repr__(self):
+        return f"QuaternionArray({self.data!r})"
+
+    def _blocks(self):
+        for start in range(0, len(self.data), BLOCK_ROWS):
+            yield slice(start, start + BLOCK_ROWS)
+
+    def _rows(self, other, rows):
+        other = np.asarray(other, dtype=float)
+        return other[rows] if other.ndim == 2 else other
+
+    def multiply(self, other, left=False, inplace=False):
+        """
+        Product self * other, or other * self with left=True.
+        other is a single quaternion or an (N, 4) array.
+        """
+        if not inplace:
+            return QuaternionArray(quaternion_multiply(other, self.data) if left else quaternion_multiply(self.data, other))
+
+        for rows in self._blocks():
+            block = self.data[rows]
+            other_rows = self._rows(other, rows)
+            if left:
+                quaternion_multiply(other_rows, block, out=block)
+            else:
+                quaternion_multiply(block, other_rows, out=block)
+        return self
+
+    def __mul__(self, other):
+        if isinstance(other, numbers.Real):
+            return QuaternionArray(self.data * other)
+        return self.multiply(other)
+
+    def __rmul__(self, other):
+        if isinstance(other, numbers.Real):
+            return QuaternionArray(self.data * other)
+        return self.multiply(other, left=True)
+
+    def __imul__(self, other):
+        if isinstance(other, numbers.Real):
+            self.data *= other
+            return self
+        return self.multiply(other, inplace=True)
+
+    def conjugate(self, inplace=False):
+        if not inplace:
+            return QuaternionArray(quaternion_conjugate(self.data))
+        self.data[:, 1:] *= -1
+        return self
+
+    def __invert__(self):
+        return self.conjugate()
+
+    def norm(self):
+        return np.linalg.norm(self.data, axis=1)
+
+    def normalize(self, inplace=False):
+        target = self if inplace else QuaternionArray(self.data, copy=True)
+        for rows in target._blocks():
+            block = target.data[rows]
+            norm = np.linalg.norm(block, axis=1)
+            norm[norm == 0] = 1
+            block /= norm[:, None]
+        return target
+
+    def rotate(self, points, out=None):
+        """
+        Rotate points by every quaternion: points broadcasts against (N, 3).
+        """
+        return rotate_points(self.data, points, out=out)
+
+    def to_matrix(self):
+        return to_matrix(self.data)
+
+    def to_euler(self, order="XYZ"):
+        return to_euler(self.data, order)
+
+
+# Products over fewer rows than this are not worth splitting across threads
+PARALLEL_MIN_ROWS = 1 << 15
+
+# Longest block a scan walks through one position at a time
+SCAN_BLOCK = 256
+
+
+def _parallel_multiply(pool, workers, q1, q2, out):
+    """
+    out = q1 * q2 with the rows shared out between the pool's threads
+    (NumPy releases the GIL inside the products).
+    """
+    n = len(out)
+    if pool is None or n < PARALLEL_MIN_ROWS:
+        return quaternion_multiply(q1, q2, out=out)
+
+    bounds = np.linspace(0, n, workers + 1).astype(int)
+
+    def rows(q, a, b):
+        return q[a:b] if q.ndim > 1 and len(q) == n else q
+
+    futures = [
+        pool.submit(quaternion_multiply, rows(q1, a, b), rows(q2, a, b), out[a:b])
+        for a, b in zip(bounds[:-1], bounds[1:]) if b > a
+    ]
+    for future in futures:
+        future.result()
+    return out
+
+
+def _left_scan(pool, workers, q, out):
+    # out[i] = q[i] * ... * q[0]
+    n = len(q)
+    block = max(2, min(SCAN_BLOCK, math.isqrt(n)))
+    if n <= block:
+        out[0] = q[0]
+        for i in range(1, n):
+            quaternion_multiply(q[i], out[i - 1], out=out[i])
+        return out
+
+    # Cut the sequence into blocks and lay them out so that position j of
+    # every block is one contiguous row work[j]
+    blocks = -(-n // block)
+    full = n // block
+    work = np.empty((block, blocks, 4))
+    by_block = work.transpose(1, 0, 2)
+    by_block[:full] = q[:full * block].reshape(full, block, 4)
+    if full < blocks:
+        rest = n - full * block
+        by_block[full, :rest] = q[full * block:]
+        by_block[full, rest:] = (1, 0, 0, 0)
+
+    # 1. scan every block side by side, one vectorized product per position
+    for j in range(1, block):
+        _parallel_multiply(pool, workers, work[j], work[j - 1], work[j])
+
+    # 2. running product of the block totals
+    totals = _left_scan(pool, workers, work[-1].copy(), np.empty((blocks, 4)))
+
+    # 3. offset each block by everything that came before it
+    for j in range(block):
+        _parallel_multiply(pool, workers, work[j, 1:], totals[:-1], work[j, 1:])
+
+    out[:full * block].reshape(full, block, 4)[...] = by_block[:full]
+    if full < blocks:
+        out[full * block:] = by_block[full, :n - full * block]
+    return out
+
+
+def cumulative_multiply(q, out=None, left=True, workers=None):
+    """
+    Every running product of a chain of incremental rotations, as a blocked parallel scan.
+    With left=True (world-frame increments) out[i] = q[i] * ... * q[1] * q[0];
+    with left=False (body-frame increments, e.g. gyro samples) out[i] = q[0] * q[1] * ... * q[i].
+    q has shape (N, 4); workers defaults to the number of cores.
+    Returns: array of shape (N, 4)
+    """
+    q = _as_quaternions(q)
+    if q.ndim != 2:
+        raise ValueError(f"expected an (N, 4) array, got shape {q.shape}")
+    if out is None:
+        out = np.empty(q.shape)
+    if len(q) == 0:
+        return out
+
+    workers = workers or os.cpu_count() or 1
+    pool = ThreadPoolExecutor(workers) if workers > 1 and len(q) >= PARALLEL_MIN_ROWS else None
+    try:
+        if left:
+            _left_scan(pool, workers, q, out)
+        else:
+            # q[0] * ... * q[i] is the conjugate of q[i]* * ... * q[0]*
+            _left_scan(pool, workers, quaternion_conjugate(q), out)
+            quaternion_conjugate(out, out=out)
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return out
+
+
+def multiply_reduce(q, left=True, workers=None):
+    """
+    Total product of a chain of rotations by pairwise tree reduction, each level spread across cores.
+    With left=True returns q[N-1] * ... * q[1] * q[0]; with left=False q[0] * q[1] * ... * q[N-1].
+    Returns: array of shape (4,)
+    """
+    q = _as_quaternions(q)
+    if q.ndim != 2:
+        raise ValueError(f"expected an (N, 4) array, got shape {q.shape}")
+    if len(q) == 0:
+        return np.array([1.0, 0.0, 0.0, 0.0])
+
+    workers = workers or os.cpu_count() or 1
+    pool = ThreadPoolExecutor(workers) if workers > 1 and len(q) >= PARALLEL_MIN_ROWS else None
+    try:
+        while len(q) > 1:
+            pairs = len(q) // 2
+            earlier, later = q[0:2 * pairs:2], q[1:2 * pairs:2]
+            level = np.empty((pairs + len(q) % 2, 4))
+            if left:
+                _parallel_multiply(pool, workers, later, earlier, level[:pairs])
+            else:
+                _parallel_multiply(pool, workers, earlier, later, level[:pairs])
+            if len(q) % 2:
+                level[-1] = q[-1]
+            q = level
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    return q[0].copy()
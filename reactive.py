@@ -0,0 +1,58 @@
+import numpy as np
+from manim import Mobject, ValueTracker
+
+
+
+def fingerprint(source):
+    """
+    Cheap value that changes whenever an input of a Computed changes.
+    ValueTracker -> its value, Computed -> its version, Mobject -> the first and last
+    point of its first family member with points (enough to notice moves and rotations).
+    """
+    if isinstance(source, Computed):
+        source()
+        return source.version
+    if isinstance(source, ValueTracker):
+        return float(source.get_value())
+    if isinstance(source, Mobject):
+        points = source.points
+        if len(points) == 0:
+            members = source.family_members_with_points()
+            if not members:
+                return None
+            points = members[0].points
+        return points[[0, -1]].tobytes()
+    raise TypeError(f"cannot depend on {type(source).__name__}")
+
+
+class Computed:
+    """
+    A value derived from trackers, mobjects or other Computed values.
+    Calling it returns the cached result; func runs again only when the fingerprint of
+    one of the inputs changed since the last call, so within a frame every updater that
+    asks for it shares one evaluation. Downstream Computeds see a new version.
+    """
+
+    def __init__(self, func, *inputs):
+        self.func = func
+        self.inputs = inputs
+        self.version = 0
+        self.evaluations = 0
+        self._key = None
+        self._value = None
+
+    def __call__(self):
+        key = tuple(fingerprint(source) for source in self.inputs)
+        if self.version == 0 or key != self._key:
+            value = self.func()
+            if isinstance(value, np.ndarray):
+                # Shared by every caller, so nobody gets to modify it in place
+                value.setflags(write=False)
+            self._key = key
+            self._value = value
+            self.version += 1
+            self.evaluations += 1
+        return self._value
+
+    def __getitem__(self, index):
+        return self()[index]
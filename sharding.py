@@ -0,0 +1,239 @@
+import argparse
+import multiprocessing
+import os
+import subprocess
+import sys
+import tempfile
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+from manim import Animation, config, linear, smooth, tempconfig
+
+from baking import Playback, bake_cache, tracker_values
+from batch_render import QUALITIES, load_module, private_tex_dir
+from play_cache import cached_play, finish_skipped_plays
+
+
+
+# Number of plays each play_tracker() call is split into; set by the coordinator
+SHARDS_ENV = "MANIM_PLAY_SHARDS"
+
+
+class TrackerSegment(Animation):
+    """
+    Moves a ValueTracker along part of a longer tracker animation.
+    The whole animation is value = start_value + delta * rate_func(t) for t in [0, 1];
+    this segment covers t in alpha_range, so the value at any frame only depends on the
+    global time and never on earlier segments having run.
+    on_interpolate, if given, is called with that global time every frame.
+    """
+
+    def __init__(self, tracker, start_value, delta, rate_func=smooth, alpha_range=(0, 1), on_interpolate=None, **kwargs):
+        super().__init__(tracker, rate_func=linear, **kwargs)
+        self.start_value = start_value
+        self.delta = delta
+        self.value_rate_func = rate_func
+        self.alpha_range = alpha_range
+        self.on_interpolate = on_interpolate
+
+    def interpolate_mobject(self, alpha):
+        a0, a1 = self.alpha_range
+        t = a0 + alpha * (a1 - a0)
+        self.mobject.set_value(self.start_value + self.delta * self.value_rate_func(t))
+        if self.on_interpolate is not None:
+            self.on_interpolate(t)
+
+
+def play_tracker(scene, tracker, delta, run_time=1, rate_func=smooth, shards=None, bake=()):
+    """
+    Equivalent of scene.play(tracker.animate.increment_value(delta), ...) that can be
+    split into several consecutive plays, each a whole number of frames long, so
+    sharded renders can hand different parts of one long spin to different processes.
+    Frames land on exactly the same global times as the unsplit play.
+    shards defaults to the MANIM_PLAY_SHARDS environment variable, else 1.
+    Every play goes through cached_play, so unchanged spins are not rendered again.
+
+    bake lists (vertex_dots, positions) pairs, positions mapping an array of tracker
+    values to (frames, n_points, 3); all frames are computed up front and the groups
+    play them back instead of evaluating their live functions.
+    Returns: the baked arrays, in the order of bake
+    """
+    if shards is None:
+        shards = int(os.environ.get(SHARDS_ENV, 1))
+    start_value = tracker.get_value()
+    total_frames = max(1, round(run_time * config.frame_rate))
+    shards = max(1, min(shards, total_frames))
+
+    playback = Playback(bake, tracker_values(start_value, delta, rate_func, total_frames)) if bake else None
+    on_interpolate = playback.seek if playback is not None else None
+    try:
+        if shards == 1:
+            cached_play(scene, TrackerSegment(tracker, start_value, delta, rate_func=rate_func, on_interpolate=on_interpolate), run_time=run_time)
+        else:
+            bounds = [round(total_frames * i / shards) for i in range(shards + 1)]
+            for first, last in zip(bounds, bounds[1:]):
+                cached_play(
+                    scene,
+                    TrackerSegment(
+                        tracker, start_value, delta, rate_func=rate_func,
+                        alpha_range=(first / total_frames, last / total_frames), on_interpolate=on_interpolate,
+                    ),
+                    run_time=(last - first) / config.frame_rate,
+                )
+    finally:
+        if playback is not None:
+            playback.restore()
+    return playback.arrays if playback is not None else []
+
+
+def _replay_skipped_frames(scene):
+    # Skipped plays normally jump to their end in one update; stepping their updaters
+    # frame by frame, without drawing anything, keeps history-dependent updaters such as
+    # trails identical to a full render when a shard starts in the middle of the scene
+    finish_skipped_plays(scene)
+    get_time_progression = scene.get_time_progression
+
+    def frame_accurate(run_time, *args, **kwargs):
+        kwargs["override_skip_animations"] = True
+        return get_time_progression(run_time, *args, **kwargs)
+
+    scene.get_time_progression = frame_accurate
+
+
+def play_durations(path, scene_name, quality):
+    """
+    Skip through the whole scene without rendering. Constructing the scene typesets its
+    TeX into the shared tex_dir and bakes every play_tracker() spin into the bake cache,
+    which the workers then start from.
+    Returns: the run time of every play, in order
+    """
+    scene_class = getattr(load_module(path), scene_name)
+    options = {
+        "quality": quality,
+        "input_file": os.path.abspath(path),
+        "disable_caching": True,
+        "write_to_movie": False,
+        "from_animation_number": sys.maxsize,
+    }
+    durations = []
+    with tempconfig(options):
+        scene = scene_class()
+        play = scene.renderer.play
+
+        def recording_play(scene, *args, **kwargs):
+            play(scene, *args, **kwargs)
+            durations.append(scene.duration)
+
+        scene.renderer.play = recording_play
+        scene.render()
+    return durations
+
+
+def split_plays(durations, parts):
+    """
+    Contiguous (first, last) play ranges with roughly equal run time.
+    The first range always holds at least two plays, since manim reads an
+    upto_animation_number of 0 as no limit.
+    """
+    total = sum(durations)
+    ranges = []
+    first = 0
+    done = 0
+    for i, duration in enumerate(durations):
+        done += duration
+        enough = done >= total * (len(ranges) + 1) / parts
+        if enough and (ranges or i >= 1) and i < len(durations) - 1:
+            ranges.append((first, i))
+            first = i + 1
+    ranges.append((first, len(durations) - 1))
+    return ranges
+
+
+def render_plays(path, scene_name, quality, first, last):
+    """
+    Render plays first..last (inclusive) of a scene in this process.
+    Returns: (play index, partial movie file) pairs for the rendered plays
+    """
+    scene_class = getattr(load_module(path), scene_name)
+    options = {
+        "quality": quality,
+        "input_file": os.path.abspath(path),
+        "disable_caching": True,
+        "max_files_cached": -1,
+        "from_animation_number": first,
+        "upto_animation_number": last,
+        "output_file": f"{scene_name}_plays_{first:05}_{last:05}",
+    }
+    # Every worker replays the whole prefix, so the bakes it loads are hits on entries the
+    # dry run wrote; recording them would only contend for the index
+    bake_cache.track_hits = False
+    with tempconfig(options), private_tex_dir(options["output_file"]):
+        scene = scene_class()
+        _replay_skipped_frames(scene)
+        scene.render()
+        partial_movie_files = scene.renderer.file_writer.partial_movie_files
+    return [(i, str(file)) for i, file in enumerate(partial_movie_files) if file is not None and first <= i <= last]
+
+
+def concatenate(files, output):
+    """
+    Join partial movies without re-encoding; they all share the same codec settings.
+    """
+    with tempfile.NamedTemporaryFile("w", suffix=".txt", delete=False) as f:
+        for file in files:
+            f.write(f"file '{file}'\n")
+        list_path = f.name
+    try:
+        subprocess.run(
+            ["ffmpeg", "-y", "-loglevel", "error", "-f", "concat", "-safe", "0", "-i", list_path, "-c", "copy", output],
+            check=True,
+        )
+    finally:
+        os.remove(list_path)
+
+
+def default_output(path, scene_name, quality):
+    """
+    Where manim itself writes the scene's movie when it is rendered unsharded.
+    """
+    with tempconfig({"quality": quality, "input_file": os.path.abspath(path)}):
+        return os.path.join(config.get_dir("video_dir"), f"{scene_name}{config.movie_file_extension}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Render one scene split into play ranges across processes.")
+    parser.add_argument("module")
+    parser.add_argument("scene")
+    parser.add_argument("-q", "--quality", choices=sorted(QUALITIES), default="h")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count())
+    parser.add_argument("--shards", type=int, help="plays per play_tracker() call (default: --jobs)")
+    parser.add_argument("-o", "--output", help="output movie (default: where manim writes the unsharded movie)")
+    args = parser.parse_args(argv)
+
+    quality = QUALITIES[args.quality]
+    # The dry run and every worker must split the spins identically, or play numbers differ
+    os.environ[SHARDS_ENV] = str(args.shards or args.jobs)
+
+    start = time.perf_counter()
+    durations = play_durations(args.module, args.scene, quality)
+    ranges = split_plays(durations, args.jobs)
+    print(f"{args.scene}: {len(durations)} plays, {sum(durations):.1f}s of animation, {len(ranges)} ranges")
+
+    context = multiprocessing.get_context("spawn")
+    with ProcessPoolExecutor(max_workers=args.jobs, mp_context=context) as pool:
+        futures = [pool.submit(render_plays, args.module, args.scene, quality, first, last) for first, last in ranges]
+        partials = sorted(pair for future in futures for pair in future.result())
+
+    files = [file for _, file in partials]
+    if not files:
+        print(f"{args.scene}: the workers produced no partial movies, nothing to concatenate", file=sys.stderr)
+        return 1
+    output = args.output or default_output(args.module, args.scene, quality)
+    os.makedirs(os.path.dirname(os.path.abspath(output)), exist_ok=True)
+    concatenate(files, output)
+    print(f"Wrote {output} from {len(files)} partial movies in {time.perf_counter() - start:.1f}s")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
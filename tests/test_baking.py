@@ -0,0 +1,51 @@
+import os
+import sys
+
+import numpy as np
+import pytest
+
+pytest.importorskip("manim")
+
+import play_cache
+from baking import BakeCache
+
+SPEED = 2.0
+
+
+def positions(values):
+    return np.stack([np.outer(values * SPEED, (1, 0, 0))], axis=1)
+
+
+def nested_positions():
+    return lambda values: positions(values) * SPEED
+
+
+@pytest.fixture
+def cache(tmp_path, monkeypatch):
+    # Functions defined in this file count as project code
+    monkeypatch.setattr(play_cache, "ROOT", os.path.dirname(os.path.abspath(__file__)))
+    return BakeCache(str(tmp_path))
+
+
+def test_key_changes_with_module_constant(cache, monkeypatch):
+    values = np.linspace(0, 1, 5)
+    key = cache.key(positions, values)
+    assert cache.key(positions, values) == key
+    monkeypatch.setattr(sys.modules[__name__], "SPEED", 3.0)
+    assert cache.key(positions, values) != key
+
+
+def test_key_follows_constants_read_in_nested_lambdas(cache, monkeypatch):
+    values = np.linspace(0, 1, 5)
+    key = cache.key(nested_positions(), values)
+    monkeypatch.setattr(sys.modules[__name__], "SPEED", 3.0)
+    assert cache.key(nested_positions(), values) != key
+
+
+def test_load_hits_after_miss(cache):
+    values = np.linspace(0, 1, 5)
+    baked = cache.load(positions, values)
+    again = cache.load(positions, values)
+    np.testing.assert_array_equal(baked, again)
+    assert cache.stats()["hits"] == 1
+    assert cache.stats()["misses"] == 1
@@ -0,0 +1,16 @@
+import os
+
+import pytest
+
+pytest.importorskip("manim")
+
+from batch_render import ROOT, discover_scenes
+
+
+def test_discover_scenes_in_source_order():
+    scenes = discover_scenes(os.path.join(ROOT, "Quaternions.py"))
+    names = [name for name, _ in scenes]
+    assert "ComplexRotationsSquare" in names
+    assert "QuaternionRotations3D" in names
+    assert names.index("ComplexRotationsSquare") < names.index("QuaternionRotations3D")
+    assert all(length > 0 for _, length in scenes)
@@ -0,0 +1,38 @@
+import os
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+manim = pytest.importorskip("manim")
+
+import play_cache
+
+OFFSET = 1.0
+
+
+def shift_by_offset(mobject, dt):
+    mobject.shift(OFFSET * dt * manim.RIGHT)
+
+
+@pytest.fixture(autouse=True)
+def project_root(monkeypatch):
+    # Functions defined in this file count as project code
+    monkeypatch.setattr(play_cache, "ROOT", os.path.dirname(os.path.abspath(__file__)))
+
+
+def scene_with(mobject):
+    return SimpleNamespace(mobjects=[mobject], renderer=SimpleNamespace(camera=SimpleNamespace()))
+
+
+def test_updater_key_changes_with_module_constant(monkeypatch):
+    dot = manim.Dot()
+    dot.add_updater(lambda m, dt: shift_by_offset(m, dt))
+    scene = scene_with(dot)
+    components = play_cache.play_components(scene, [], {"run_time": 1})
+    assert play_cache.play_components(scene, [], {"run_time": 1}) == components
+
+    monkeypatch.setattr(sys.modules[__name__], "OFFSET", 2.0)
+    changed = play_cache.play_components(scene, [], {"run_time": 1})
+    assert changed["updaters"] != components["updaters"]
+    assert changed["snapshot"] == components["snapshot"]
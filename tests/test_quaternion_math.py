@@ -0,0 +1,35 @@
+import numpy as np
+
+from quaternion_math import QuaternionArray, quaternion_multiply
+
+
+def random_quaternions(n, seed=0):
+    return np.random.default_rng(seed).normal(size=(n, 4))
+
+
+def test_stepped_slice_is_a_view():
+    qa = QuaternionArray(random_quaternions(9))
+    assert np.shares_memory(qa[::2].data, qa.data)
+
+
+def test_inplace_normalize_on_slice_changes_parent():
+    data = random_quaternions(9)
+    qa = QuaternionArray(data.copy())
+    qa[::2].normalize(inplace=True)
+    np.testing.assert_allclose(np.linalg.norm(qa.data[::2], axis=1), 1)
+    np.testing.assert_array_equal(qa.data[1::2], data[1::2])
+
+
+def test_inplace_multiply_on_slice_changes_parent():
+    data = random_quaternions(10)
+    qa = QuaternionArray(data.copy())
+    q = np.array([0.5, 0.5, 0.5, 0.5])
+    rows = qa[1::3]
+    rows *= q
+    np.testing.assert_allclose(qa.data[1::3], quaternion_multiply(data[1::3], q))
+    np.testing.assert_array_equal(qa.data[0::3], data[0::3])
+
+
+def test_fancy_indexing_copies():
+    qa = QuaternionArray(random_quaternions(5))
+    assert not np.shares_memory(qa[[0, 2]].data, qa.data)
@@ -0,0 +1,182 @@
+import inspect
+from graphlib import TopologicalSorter
+
+import numpy as np
+from manim import Mobject, VMobject, logger
+
+
+
+def _member_visible(mobject):
+    if not isinstance(mobject, VMobject):
+        return True
+    if np.any(mobject.get_fill_opacities() > 0):
+        return True
+    for background in (False, True):
+        if np.any(np.asarray(mobject.get_stroke_width(background=background)) > 0) and np.any(mobject.get_stroke_opacities(background=background) > 0):
+            return True
+    return False
+
+
+def is_transparent(mobject):
+    """
+    True when the family has points and none of them can show up on screen:
+    every member with points is a VMobject with zero fill and zero (or zero-width) stroke.
+    Families without any points (trackers of nothing, schedulers) are never transparent.
+    """
+    members = mobject.family_members_with_points()
+    return bool(members) and not any(_member_visible(member) for member in members)
+
+
+class UpdaterScheduler(Mobject):
+    """
+    Runs registered updaters exactly once per frame, in dependency order.
+    Add the scheduler to the scene and register (mobject, updater) pairs with schedule()
+    instead of mobject.add_updater(). depends_on lists mobjects whose updaters must
+    run first; a dependency that is not registered itself resolves to the registered
+    mobject whose family contains it (a dot inside a VertexDots group, say).
+    Mobjects whose updating is suspended by an animation are skipped, as manim would.
+    With cull_transparent, fully transparent mobjects are skipped too, unless a
+    visible mobject depends on them.
+    """
+
+    def __init__(self, cull_transparent=False, **kwargs):
+        super().__init__(**kwargs)
+        self.cull_transparent = cull_transparent
+        self._updaters = {}
+        self._depends_on = {}
+        self._order = None
+        self._dependents = None
+        self.frames = 0
+        self.invocations = 0
+        self.frame_invocations = 0
+        self.culled = 0
+        self.add_updater(lambda m, dt: m.run(dt))
+
+    def schedule(self, mobject, updater, depends_on=()):
+        """
+        Register updater for mobject, after the updaters of depends_on.
+        Returns: mobject, so construction can be chained
+        """
+        takes_dt = "dt" in inspect.signature(updater).parameters
+        self._updaters.setdefault(mobject, []).append((updater, takes_dt))
+        self._depends_on.setdefault(mobject, set()).update(depends_on)
+        self._order = None
+        return mobject
+
+    def unschedule(self, mobject):
+        self._updaters.pop(mobject, None)
+        self._depends_on.pop(mobject, None)
+        self._order = None
+        return self
+
+    def _resolve(self, dependency, dependent):
+        if dependency in self._updaters:
+            return dependency
+        for mobject in self._updaters:
+            if mobject is not dependent and dependency in mobject.get_family():
+                return mobject
+        return None
+
+    def order(self):
+        """
+        Registered mobjects in the order their updaters run.
+        """
+        if self._order is None:
+            graph = {}
+            for mobject, dependencies in self._depends_on.items():
+                resolved = (self._resolve(dependency, mobject) for dependency in dependencies)
+                graph[mobject] = {node for node in resolved if node is not None}
+            self._order = list(TopologicalSorter(graph).static_order())
+            self._dependents = {mobject: [] for mobject in self._order}
+            for mobject, dependencies in graph.items():
+                for dependency in dependencies:
+                    self._dependents[dependency].append(mobject)
+        return self._order
+
+    def _needed(self, order):
+        needed = set()
+        for mobject in reversed(order):
+            if not is_transparent(mobject) or any(d in needed for d in self._dependents[mobject]):
+                needed.add(mobject)
+        return needed
+
+    def run(self, dt=0):
+        count = 0
+        order = self.order()
+        needed = self._needed(order) if self.cull_transparent else None
+        for mobject in order:
+            if mobject.updating_suspended:
+                continue
+            if needed is not None and mobject not in needed:
+                self.culled += len(self._updaters[mobject])
+                continue
+            for updater, takes_dt in self._updaters[mobject]:
+                if takes_dt:
+                    updater(mobject, dt)
+                else:
+                    updater(mobject)
+                count += 1
+        self.frames += 1
+        self.invocations += count
+        self.frame_invocations = count
+        return self
+
+    def report(self):
+        """
+        Returns: a one-line summary of updater invocations per frame
+        """
+        average = self.invocations / self.frames if self.frames else 0
+        return (
+            f"{len(self._updaters)} scheduled mobjects, {self.frame_invocations} updater calls "
+            f"last frame, {average:.1f} per frame over {self.frames} frames, "
+            f"{self.culled} calls skipped on transparent mobjects"
+        )
+
+
+class TransparentCullingScene:
+    """
+    Scene mixin, listed before the Scene class: fully transparent mobjects are neither
+    updated nor drawn until their opacity comes back.
+    Updaters are skipped for transparent families, and the camera's list of mobjects
+    to display drops transparent members. The skipped work is logged at tear_down.
+    """
+
+    def setup(self):
+        super().setup()
+        self.culled_updaters = 0
+        self.culled_renders = 0
+        camera = getattr(self.renderer, "camera", None)
+        if camera is not None and hasattr(camera, "get_mobjects_to_display"):
+            get_mobjects_to_display = camera.get_mobjects_to_display
+
+            def visible_mobjects_to_display(*args, **kwargs):
+                mobjects = get_mobjects_to_display(*args, **kwargs)
+                visible = [mobject for mobject in mobjects if _member_visible(mobject)]
+                self.culled_renders += len(mobjects) - len(visible)
+                return visible
+
+            camera.get_mobjects_to_display = visible_mobjects_to_display
+
+    def update_mobjects(self, dt):
+        for mobject in self.mobjects:
+            self._update_visible(mobject, dt)
+
+    def _update_visible(self, mobject, dt):
+        if mobject.updating_suspended:
+            return
+        family = mobject.get_family()
+        if not any(member.updaters for member in family):
+            return
+        if is_transparent(mobject):
+            self.culled_updaters += sum(len(member.updaters) for member in family)
+            return
+        mobject.update(dt, recursive=False)
+        for submobject in mobject.submobjects:
+            self._update_visible(submobject, dt)
+
+    def tear_down(self):
+        super().tear_down()
+        logger.info(
+            f"{type(self).__name__}: skipped {self.culled_updaters} updater calls and "
+            f"{self.culled_renders} mobject draws on transparent mobjects"
+        )